@@ -1,46 +1,193 @@
 # ast_utils.py
 import ast
 import difflib
-from typing import List, Tuple
+import hashlib
+import re
+import weakref
+from collections import OrderedDict
+from typing import Iterator, List, Tuple
+
+try:
+    # cdifflib is a C reimplementation of difflib's SequenceMatcher
+    from cdifflib import CSequenceMatcher as _SequenceMatcher
+except ImportError:
+    _SequenceMatcher = difflib.SequenceMatcher
+
+def _format_range_unified(start: int, stop: int) -> str:
+    """Convert a range to the "ed" format, as difflib's private helper does."""
+    beginning = start + 1  # lines start numbering with one
+    length = stop - start
+    if length == 1:
+        return f'{beginning}'
+    if not length:
+        beginning -= 1  # empty ranges begin at line just before the range
+    return f'{beginning},{length}'
+
+def _unified_diff(a: List[str], b: List[str], n: int = 3):
+    """Same output as difflib.unified_diff(a, b, lineterm=''), using _SequenceMatcher."""
+    started = False
+    for group in _SequenceMatcher(None, a, b).get_grouped_opcodes(n):
+        if not started:
+            started = True
+            yield '--- '
+            yield '+++ '
+        first, last = group[0], group[-1]
+        old_range = _format_range_unified(first[1], last[2])
+        new_range = _format_range_unified(first[3], last[4])
+        yield f'@@ -{old_range} +{new_range} @@'
+        for tag, i1, i2, j1, j2 in group:
+            if tag == 'equal':
+                for line in a[i1:i2]:
+                    yield ' ' + line
+                continue
+            if tag in ('replace', 'delete'):
+                for line in a[i1:i2]:
+                    yield '-' + line
+            if tag in ('replace', 'insert'):
+                for line in b[j1:j2]:
+                    yield '+' + line
+
+_HUNK_RE = re.compile(r'^@@ -(\d+)(?:,(\d+))? \+(\d+)(?:,(\d+))? @@')
+
+_PARSE_CACHE_SIZE = 128
+_PARSE_CACHE: "OrderedDict[bytes, ast.AST]" = OrderedDict()
+_FUNCTION_DEFS_CACHE: "weakref.WeakKeyDictionary[ast.AST, List[ast.FunctionDef]]" = weakref.WeakKeyDictionary()
+
+def _parse_code(code: str) -> ast.AST:
+    """Parse Python source code into an AST, reusing trees for identical sources.
+
+    Cached trees are shared between callers and must not be mutated.
+    """
+    key = hashlib.blake2b(code.encode('utf-8'), digest_size=16).digest()
+    tree = _PARSE_CACHE.get(key)
+    if tree is not None:
+        _PARSE_CACHE.move_to_end(key)
+        return tree
+    tree = ast.parse(code)
+    _PARSE_CACHE[key] = tree
+    if len(_PARSE_CACHE) > _PARSE_CACHE_SIZE:
+        _PARSE_CACHE.popitem(last=False)
+    return tree
+
+def clear_parse_cache() -> None:
+    """Drop all cached parse trees and the function definitions found in them."""
+    _PARSE_CACHE.clear()
+    _FUNCTION_DEFS_CACHE.clear()
+
+def _iter_defs(tree: ast.AST) -> Iterator[ast.FunctionDef]:
+    """Yield FunctionDef nodes in source order using a single explicit stack."""
+    stack = [tree]
+    pop, push = stack.pop, stack.extend
+    while stack:
+        node = pop()
+        if isinstance(node, ast.FunctionDef):
+            yield node
+        children = list(ast.iter_child_nodes(node))
+        children.reverse()
+        push(children)
 
 class AstUtils:
     """
     Provides AST-based code diffing and patch validation utilities.
     """
-    @staticmethod
-    def parse_code(code: str) -> ast.AST:
-        """Parse Python source code into an AST."""
-        return ast.parse(code)
+    parse_code = staticmethod(_parse_code)
 
     @staticmethod
     def get_function_defs(tree: ast.AST) -> List[ast.FunctionDef]:
         """Extract all top-level function definitions from the AST."""
-        return [node for node in ast.walk(tree) if isinstance(node, ast.FunctionDef)]
+        defs = _FUNCTION_DEFS_CACHE.get(tree)
+        if defs is None:
+            body = getattr(tree, 'body', ())
+            defs = [node for node in body if isinstance(node, ast.FunctionDef)]
+            _FUNCTION_DEFS_CACHE[tree] = defs
+        return list(defs)
+
+    @staticmethod
+    def get_all_function_defs(tree: ast.AST) -> List[ast.FunctionDef]:
+        """Extract function definitions at any depth (methods, nested functions)."""
+        return list(_iter_defs(tree))
 
     @staticmethod
     def diff_code(old_code: str, new_code: str) -> List[str]:
         """Compute a unified diff between two code texts."""
         old_lines = old_code.splitlines(keepends=True)
         new_lines = new_code.splitlines(keepends=True)
-        diff = difflib.unified_diff(old_lines, new_lines, lineterm='')
-        return list(diff)
+        return list(_unified_diff(old_lines, new_lines))
 
     @staticmethod
     def validate_patch(old_code: str, patch: str) -> bool:
         """Validate that a unified diff patch cleanly applies to the old code."""
-        old_lines = old_code.splitlines(keepends=True)
         try:
-            patched = difflib.restore(patch.splitlines(), 1)
-            # If restore succeeds without exception, consider it valid
+            AstUtils.apply_patch(old_code, patch)
             return True
-        except Exception:
+        except ValueError:
             return False
 
     @staticmethod
     def apply_patch(old_code: str, patch: str) -> str:
-        """Apply a unified diff patch to old_code, returning patched code."""
-        # This method assumes patch is in unified diff format
-        patched_lines = []
+        """Apply a unified diff patch to old_code, returning patched code.
+
+        Raises ValueError if the patch is malformed or its context/removed
+        lines do not match old_code.
+        """
+        old_lines = old_code.splitlines(keepends=True)
+        patched_lines: List[str] = []
+        pos = 0  # index into old_lines of the next unconsumed line
+        found_hunk = False
         diff = patch.splitlines(keepends=True)
-        patched_lines = list(difflib.restore(diff, 1))
+        i = 0
+        while i < len(diff):
+            header = _HUNK_RE.match(diff[i])
+            i += 1
+            if header is None:
+                continue  # '---'/'+++' file headers and git metadata
+            found_hunk = True
+            old_start = int(header.group(1))
+            old_count = int(header.group(2) or 1)
+            new_count = int(header.group(4) or 1)
+            # A zero-length range refers to the line *before* the hunk
+            start = old_start - 1 if old_count else old_start
+            if start < pos or start > len(old_lines):
+                raise ValueError(f"Hunk at line {old_start} is out of order or out of range")
+            patched_lines.extend(old_lines[pos:start])
+            pos = start
+            seen_old = seen_new = 0
+            last_tag = ''
+            while i < len(diff) and (seen_old < old_count or seen_new < new_count):
+                line = diff[i]
+                i += 1
+                tag, text = line[:1], line[1:]
+                if tag in ('\n', '\r'):
+                    tag, text = ' ', line  # context line whose leading space was stripped
+                if tag == '\\':
+                    # "\ No newline at end of file" after a removed line only
+                    # describes the old file
+                    if last_tag in (' ', '+') and patched_lines:
+                        patched_lines[-1] = patched_lines[-1].rstrip('\r\n')
+                    continue
+                last_tag = tag
+                if tag in (' ', '-'):
+                    if pos >= len(old_lines) or old_lines[pos].rstrip('\r\n') != text.rstrip('\r\n'):
+                        raise ValueError(f"Patch does not match original at line {pos + 1}")
+                    if tag == ' ':
+                        patched_lines.append(old_lines[pos])
+                        seen_new += 1
+                    pos += 1
+                    seen_old += 1
+                elif tag == '+':
+                    patched_lines.append(text)
+                    seen_new += 1
+                else:
+                    raise ValueError(f"Unexpected line in hunk: {line!r}")
+            if seen_old != old_count or seen_new != new_count:
+                raise ValueError(f"Hunk at line {old_start} is truncated")
+            if i < len(diff) and diff[i].startswith('\\'):
+                # The last line of the hunk had no trailing newline; only the
+                # new file is affected unless that line was removed
+                if last_tag in (' ', '+') and patched_lines:
+                    patched_lines[-1] = patched_lines[-1].rstrip('\r\n')
+                i += 1
+        if not found_hunk and patch.strip():
+            raise ValueError("Patch contains no unified diff hunks")
+        patched_lines.extend(old_lines[pos:])
         return ''.join(patched_lines)
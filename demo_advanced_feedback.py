@@ -6,19 +6,18 @@ This demo shows the AI improvement system with sophisticated inter-role communic
 adaptive behavior, and MCP-powered critique-refine capabilities in action!
 """
 
+import os
 import sys
 import time
 from pathlib import Path
 
 # Add the source directory to the path
-sys.path.insert(0, str(Path(__file__).parent / "src"))
+_SRC = os.fspath(Path(__file__).resolve().parent / "src")
+if _SRC not in sys.path:
+    sys.path.insert(0, _SRC)
 
 from ai_self_ext_engine.core.role import Context, RoleFeedback, FeedbackType
 from ai_self_ext_engine.goal_manager import Goal
-from ai_self_ext_engine.roles.enhanced_refine import EnhancedRefineRole
-from ai_self_ext_engine.config import MainConfig
-from ai_self_ext_engine.model_client import ModelClient
-from ai_self_ext_engine.learning_log import LearningLog
 
 def create_demo_context():
     """Create a realistic demo context with code that needs improvement."""
@@ -79,57 +78,43 @@ class DataManager:
     
     return context
 
+# (from_role, to_role, feedback type name, content) for the simulated feedback
+_REALISTIC_FEEDBACK = (
+    ("ProblemIdentificationRole", "EnhancedRefineRole", "QUALITY", {
+        "issue": "Deep nesting detected - up to 7 levels deep",
+        "severity": "high",
+        "quality_score": 0.3,
+        "suggested_fix": "Use guard clauses and early returns"
+    }),
+    ("TestRole", "EnhancedRefineRole", "ERROR", {
+        "issue": "No error handling for missing attributes",
+        "error_type": "AttributeError risk",
+        "test_failures": ["test_invalid_user", "test_missing_email"]
+    }),
+    ("PerformanceAnalyzer", "EnhancedRefineRole", "PERFORMANCE", {
+        "observation": "Inefficient nested conditions and repetitive code",
+        "suggestion": "increase_thoroughness",
+        "performance_impact": "high"
+    }),
+    ("SelfReviewRole", "EnhancedRefineRole", "STRATEGY", {
+        "suggested_strategy": "refactor_first_then_optimize",
+        "reasoning": "Code structure issues are blocking other improvements"
+    }),
+)
+
 def simulate_realistic_feedback():
     """Create realistic feedback that roles would send to each other."""
     
+    now = time.time()
     feedback_items = [
         RoleFeedback(
-            from_role="ProblemIdentificationRole",
-            to_role="EnhancedRefineRole", 
-            feedback_type=FeedbackType.QUALITY,
-            content={
-                "issue": "Deep nesting detected - up to 7 levels deep",
-                "severity": "high",
-                "quality_score": 0.3,
-                "suggested_fix": "Use guard clauses and early returns"
-            },
-            timestamp=time.time()
-        ),
-        
-        RoleFeedback(
-            from_role="TestRole",
-            to_role="EnhancedRefineRole",
-            feedback_type=FeedbackType.ERROR,
-            content={
-                "issue": "No error handling for missing attributes",
-                "error_type": "AttributeError risk",
-                "test_failures": ["test_invalid_user", "test_missing_email"]
-            },
-            timestamp=time.time()
-        ),
-        
-        RoleFeedback(
-            from_role="PerformanceAnalyzer",
-            to_role="EnhancedRefineRole",
-            feedback_type=FeedbackType.PERFORMANCE,
-            content={
-                "observation": "Inefficient nested conditions and repetitive code",
-                "suggestion": "increase_thoroughness",
-                "performance_impact": "high"
-            },
-            timestamp=time.time()
-        ),
-        
-        RoleFeedback(
-            from_role="SelfReviewRole",
-            to_role="EnhancedRefineRole",
-            feedback_type=FeedbackType.STRATEGY,
-            content={
-                "suggested_strategy": "refactor_first_then_optimize",
-                "reasoning": "Code structure issues are blocking other improvements"
-            },
-            timestamp=time.time()
+            from_role=from_role,
+            to_role=to_role,
+            feedback_type=FeedbackType[type_name],
+            content=dict(content),
+            timestamp=now
         )
+        for from_role, to_role, type_name, content in _REALISTIC_FEEDBACK
     ]
     
     return feedback_items
@@ -245,6 +230,11 @@ def demonstrate_enhanced_refine_role(context, feedback):
     print("-" * 50)
     
     try:
+        from ai_self_ext_engine.config import MainConfig
+        from ai_self_ext_engine.learning_log import LearningLog
+        from ai_self_ext_engine.model_client import ModelClient
+        from ai_self_ext_engine.roles.enhanced_refine import EnhancedRefineRole
+
         # Create the enhanced role
         config = MainConfig()
         model_client = ModelClient(config)
@@ -1,14 +1,21 @@
 ```python
 # engine.py
-from dataclasses import dataclass, field
 from typing import Any, Dict, List, Optional, Type
 from abc import ABC, abstractmethod
+import functools
 import importlib
 import yaml
-from pydantic import BaseModel, ValidationError
+from pydantic import BaseModel, ConfigDict, ValidationError
+
+try:
+    from yaml import CSafeLoader as _SafeLoader  # libyaml-backed
+except ImportError:
+    from yaml import SafeLoader as _SafeLoader
 
 # --- Configuration Schema ---
 class EngineConfig(BaseModel):
+    model_config = ConfigDict(frozen=True, extra='forbid')
+
     code_dir: str
     max_cycles: int = 1
     memory_path: str
@@ -17,16 +24,33 @@ class EngineConfig(BaseModel):
     config_version: Optional[int] = 1
 
 # --- Context Definition ---
-@dataclass
 class Context:
-    code_dir: str
-    goal: Any = None
-    todos: List[str] = field(default_factory=list)
-    patch: Optional[str] = None
-    test_results: Optional[Dict[str, Any]] = None
-    accepted: bool = True
-    should_abort: bool = False
-    metadata: Dict[str, Any] = field(default_factory=dict)
+    # No per-instance __dict__; roles touch these fields every step.
+    # Written out by hand: dataclass(slots=True) needs Python 3.10.
+    __slots__ = ('code_dir', 'goal', 'todos', 'patch', 'test_results',
+                 'accepted', 'should_abort', 'errors', 'metadata')
+
+    def __init__(
+        self,
+        code_dir: str,
+        goal: Any = None,
+        todos: Optional[List[str]] = None,
+        patch: Optional[str] = None,
+        test_results: Optional[Dict[str, Any]] = None,
+        accepted: bool = True,
+        should_abort: bool = False,
+        errors: Optional[List[str]] = None,
+        metadata: Optional[Dict[str, Any]] = None,
+    ):
+        self.code_dir = code_dir
+        self.goal = goal
+        self.todos: List[str] = [] if todos is None else todos
+        self.patch = patch
+        self.test_results = test_results
+        self.accepted = accepted
+        self.should_abort = should_abort
+        self.errors: List[str] = [] if errors is None else errors
+        self.metadata: Dict[str, Any] = {} if metadata is None else metadata
 
 # --- Role Interface ---
 class Role(ABC):
@@ -37,14 +61,21 @@ class Role(ABC):
         """
         pass
 
+# --- Dynamic class resolution ---
+@functools.lru_cache(maxsize=None)
+def _resolve(path: str) -> type:
+    """Resolve a dotted 'package.module.Class' path to the class object, once per path."""
+    module_name, class_name = path.rsplit('.', 1)
+    return getattr(importlib.import_module(module_name), class_name)
+
 # --- Engine ---
 class Engine:
     def __init__(self, config_path: str):
         # Load and validate configuration from YAML
-        with open(config_path, 'r') as f:
-            raw_config = yaml.safe_load(f)
+        with open(config_path, 'rb') as f:
+            raw_config = yaml.load(f, Loader=_SafeLoader)
         try:
-            self.config = EngineConfig(**raw_config)
+            self.config = EngineConfig.model_validate(raw_config)
         except ValidationError as e:
             raise RuntimeError(f"Invalid configuration: {e}")
 
@@ -68,7 +99,7 @@ class Engine:
                     context = role.run(context)
                 except Exception as e:
                     # Handle errors: log and abort
-                    context.metadata.setdefault('errors', []).append(str(e))
+                    context.errors.append(repr(e))
                     context.should_abort = True
                     break
 
@@ -81,24 +112,14 @@ class Engine:
 
     def _init_goal_manager(self, goals_path: str) -> Any:
         # Dynamically import GoalManager
-        module = importlib.import_module('god_engine.goal_manager')
-        GoalManager = getattr(module, 'GoalManager')
-        return GoalManager(goals_path)
+        return _resolve('god_engine.goal_manager.GoalManager')(goals_path)
 
     def _init_snapshot_store(self, memory_path: str) -> Any:
         # Dynamically import SnapshotStore
-        module = importlib.import_module('god_engine.snapshot_store')
-        SnapshotStore = getattr(module, 'SnapshotStore')
-        return SnapshotStore(memory_path)
+        return _resolve('god_engine.snapshot_store.SnapshotStore')(memory_path)
 
     def _load_roles(self, role_sequence: List[str]) -> List[Role]:
-        roles: List[Role] = []
-        for role_path in role_sequence:
-            module_name, class_name = role_path.rsplit('.', 1)
-            module = importlib.import_module(module_name)
-            role_cls: Type[Role] = getattr(module, class_name)
-            roles.append(role_cls())
-        return roles
+        return [_resolve(role_path)() for role_path in role_sequence]
 
 # --- CLI Entrypoint ---
 if __name__ == '__main__':
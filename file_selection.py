@@ -0,0 +1,38 @@
+# file_selection.py
+import keyword
+import re
+from typing import Dict, List
+
+# Identifiers of four or more characters; shorter ones match nearly every file
+_WORD_RE = re.compile(r'\b[A-Za-z_][A-Za-z0-9_]{3,}\b')
+# Prose and Python words that say nothing about which file a todo is about
+_STOP_WORDS = frozenset(keyword.kwlist) | frozenset((
+    'about', 'after', 'also', 'avoid', 'before', 'change', 'class', 'code',
+    'could', 'does', 'each', 'ensure', 'file', 'files', 'from', 'function',
+    'functions', 'handle', 'have', 'improve', 'instead', 'into', 'make',
+    'method', 'methods', 'more', 'need', 'needs', 'only', 'other', 'return',
+    'returns', 'self', 'should', 'some', 'such', 'than', 'that', 'their',
+    'them', 'then', 'there', 'these', 'this', 'those', 'update', 'used',
+    'uses', 'using', 'value', 'values', 'when', 'where', 'which', 'will',
+    'with', 'would',
+))
+
+def select_relevant_files(files: Dict[str, str], todos: List[str]) -> Dict[str, str]:
+    """
+    Keep only the files whose path or contents mention an identifier from the
+    todos as a whole word. Falls back to every file when nothing matches.
+    """
+    words = {w for todo in todos for w in _WORD_RE.findall(todo)
+             if w.lower() not in _STOP_WORDS}
+    if not words:
+        return files
+    lowered = {w.lower() for w in words}
+    in_code = re.compile(r'\b(?:%s)\b' % '|'.join(map(re.escape, sorted(words))))
+    selected = {}
+    for path, code in files.items():
+        # Path parts as identifiers, e.g. 'goal_manager' and 'goal' for goal_manager.py
+        path_parts = {part for name in re.findall(r'\w+', path.lower())
+                      for part in (name, *name.split('_'))}
+        if not lowered.isdisjoint(path_parts) or in_code.search(code):
+            selected[path] = code
+    return selected or files
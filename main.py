@@ -2,13 +2,11 @@ import argparse
 from pathlib import Path
 import os
 import sys
-import yaml # Import yaml
 
 # Add src directory to PYTHONPATH so modules under src can be imported
-sys.path.insert(0, str(Path(__file__).parent / "src"))
-
-from src.config import EngineConfig
-from src.core import Engine, Context, Role, Plugin
+_SRC = os.fspath(Path(__file__).resolve().parent / "src")
+if _SRC not in sys.path:
+    sys.path.insert(0, _SRC)
 
 def main():
     parser = argparse.ArgumentParser(description="AI Self-Extending Engine")
@@ -17,16 +15,26 @@ def main():
     # Add other CLI arguments as needed, e.g., --max-cycles, --code-dir
     args = parser.parse_args()
 
+    # Deferred so --help and argument errors don't pay for yaml/pydantic/engine imports
+    import yaml
+    from src.config import EngineConfig
+    from src.core import Engine
+
     # Load configuration
     try:
         config_path = Path(args.config)
         if not config_path.exists():
             raise FileNotFoundError(f"Config file not found at {config_path}")
         
-        with open(config_path, 'r', encoding='utf-8') as f:
-            config_data = yaml.safe_load(f)
+        try:
+            from yaml import CSafeLoader as SafeLoader  # libyaml-backed
+        except ImportError:
+            from yaml import SafeLoader
+        # Binary handle: libyaml detects the encoding and decodes in C
+        with open(config_path, 'rb') as f:
+            config_data = yaml.load(f, Loader=SafeLoader)
         
-        config = EngineConfig(**config_data)
+        config = EngineConfig.model_validate(config_data)
     except FileNotFoundError as e:
         print(f"Error: {e}")
         sys.exit(1)
@@ -1,5 +1,7 @@
 # model_client.py
+import hashlib
 import os
+from collections import OrderedDict
 import openai
 from typing import Dict, Any
 
@@ -13,8 +15,27 @@ class ModelClient:
             raise RuntimeError(f"API key not found in environment variable {api_key_env}")
         openai.api_key = self.api_key
         self.model = model_name
+        # Opt-in: sampled responses are not reproducible, so caching must be requested
+        self._cache_enabled = os.getenv('MODEL_CLIENT_CACHE') == '1'
+        self._cache: "OrderedDict[bytes, str]" = OrderedDict()
+        self._cache_cap = 256
 
     def chat(self, prompt: str, temperature: float = 0.2, max_tokens: int = 1024) -> str:
+        if not self._cache_enabled:
+            return self._chat(prompt, temperature, max_tokens)
+        key = hashlib.blake2b(repr((self.model, temperature, max_tokens, prompt)).encode(),
+                              digest_size=16).digest()
+        cached = self._cache.get(key)
+        if cached is not None:
+            self._cache.move_to_end(key)
+            return cached
+        result = self._chat(prompt, temperature, max_tokens)
+        self._cache[key] = result
+        if len(self._cache) > self._cache_cap:
+            self._cache.popitem(last=False)
+        return result
+
+    def _chat(self, prompt: str, temperature: float, max_tokens: int) -> str:
         response = openai.ChatCompletion.create(
             model=self.model,
             messages=[{'role': 'system', 'content': 'You are a code assistant.'},
@@ -26,54 +47,151 @@ class ModelClient:
 
 
 # roles/refine.py
-from typing import Any
+import string
+from itertools import chain
+from typing import Any, Dict, List, Union
 from ..engine import Role, Context
 from ..model_client import ModelClient
 from ..vcs_manager import VcsManager
+from ..file_selection import select_relevant_files
 
 class RefineRole(Role):
+    # Upper bound on code characters sent in a single model call
+    max_prompt_chars = 200_000
+
     def __init__(self, model_client: ModelClient, patch_prompt: str):
         self.model_client = model_client
         self.patch_prompt = patch_prompt  # Template with placeholders for code and todos
+        # Parse the template once into (literal, field) pairs; run() only joins
+        self._prompt_parts = [(literal, field)
+                              for literal, field, _, _ in string.Formatter().parse(patch_prompt)]
 
     def run(self, context: Context) -> Context:
         code_dir = context.code_dir
         todos = '\n'.join(context.todos)
-        # Read all code as single blob (for MVP)
         code_files = VcsManager.collect_code(code_dir)
-        combined_code = '\n'.join(code_files.values())
+        target_files = context.metadata.get('target_files')
+        if target_files:
+            selected = {p: code_files[p] for p in target_files if p in code_files}
+        else:
+            selected = select_relevant_files(code_files, context.todos)
 
-        prompt = self.patch_prompt.format(code=combined_code, todos=todos)
-        patch_text = self.model_client.chat(prompt)
-        context.patch = patch_text
+        patches = []
+        for chunk in self._chunk_files(selected):
+            # Header/file pieces are spliced straight into the prompt, so each
+            # file is copied once instead of via an intermediate combined string
+            code_pieces = list(chain.from_iterable(('### FILE: ', p, '\n', c, '\n') for p, c in chunk))
+            prompt = self._render_prompt(code=code_pieces, todos=todos)
+            patches.append(self.model_client.chat(prompt))
+        context.patch = '\n'.join(p for p in patches if p)
 
-        # Apply patch
-        VcsManager.apply_patch(code_dir, patch_text)
+        # Apply all chunk patches in one git invocation
+        VcsManager.apply_patches(code_dir, patches)
         return context
 
+    def _render_prompt(self, **values: Union[str, List[str]]) -> str:
+        """
+        Equivalent to patch_prompt.format(**values) for plain {name} fields.
+        A list value is spliced in piece by piece.
+        """
+        pieces = []
+        for literal, field in self._prompt_parts:
+            pieces.append(literal)
+            if field is not None:
+                value = values[field]
+                if isinstance(value, list):
+                    pieces.extend(value)
+                else:
+                    pieces.append(value)
+        return ''.join(pieces)
+
+    def _chunk_files(self, files: Dict[str, str]) -> List[List[tuple]]:
+        """Group files so each model call stays under max_prompt_chars (one file minimum)."""
+        chunks: List[List[tuple]] = [[]]
+        size = 0
+        for item in files.items():
+            if chunks[-1] and size + len(item[1]) > self.max_prompt_chars:
+                chunks.append([])
+                size = 0
+            chunks[-1].append(item)
+            size += len(item[1])
+        return chunks
+
 # vcs_manager.py
+import os
 import subprocess
 from pathlib import Path
-from typing import Dict
+from typing import Dict, List, Tuple
 
 class VcsManager:
     """
     Utilities for collecting code blobs and applying/rolling back patches via git.
     """
+    # Directories never worth scanning for project sources
+    _PRUNE_DIRS = frozenset({'.git', '__pycache__', '.venv', 'venv', 'node_modules',
+                             '.tox', '.mypy_cache', 'build', 'dist'})
+    # Absolute path -> (st_mtime_ns, st_size, text) of the last read
+    _CACHE: Dict[str, Tuple[int, int, str]] = {}
+
     @staticmethod
     def collect_code(code_dir: str) -> Dict[str, str]:
         files = {}
-        for path in Path(code_dir).rglob('*.py'):
-            files[path.relative_to(code_dir).as_posix()] = path.read_text()
+        cache = VcsManager._CACHE
+        root = os.path.abspath(code_dir)
+        stack = [(root, '')]
+        while stack:
+            dir_path, rel_dir = stack.pop()
+            with os.scandir(dir_path) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name not in VcsManager._PRUNE_DIRS:
+                            stack.append((entry.path, rel_dir + entry.name + '/'))
+                        continue
+                    if not entry.name.endswith('.py'):
+                        continue
+                    st = entry.stat(follow_symlinks=False)
+                    cached = cache.get(entry.path)
+                    if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+                        text = cached[2]
+                    else:
+                        with open(entry.path, encoding='utf-8') as f:
+                            text = f.read()
+                        cache[entry.path] = (st.st_mtime_ns, st.st_size, text)
+                    files[rel_dir + entry.name] = text
         return files
 
+    @staticmethod
+    def invalidate(path: str) -> None:
+        """Drop the cached contents of a file so the next collect re-reads it."""
+        VcsManager._CACHE.pop(os.path.abspath(path), None)
+
     @staticmethod
     def apply_patch(code_dir: str, patch_text: str) -> None:
-        process = subprocess.run(['git', 'apply', '--ignore-space-change', '--directory', code_dir],
-                                 input=patch_text.encode(),
-                                 cwd=code_dir)
-        if process.returncode != 0:
-            raise RuntimeError('Patch application failed')
+        VcsManager.apply_patches(code_dir, [patch_text])
+
+    @staticmethod
+    def apply_patches(code_dir: str, patches: List[str]) -> None:
+        """Apply several patches with a single `git apply` invocation."""
+        patch_text = ''.join(p if p.endswith('\n') else p + '\n' for p in patches if p.strip())
+        if not patch_text:
+            return
+        try:
+            subprocess.run(['git', 'apply', '--ignore-space-change', '--directory', code_dir],
+                           input=patch_text.encode(),
+                           cwd=code_dir,
+                           stdout=subprocess.DEVNULL,
+                           stderr=subprocess.PIPE,
+                           check=True)
+        except subprocess.CalledProcessError as e:
+            raise RuntimeError(f"Patch application failed: {e.stderr.decode(errors='replace').strip()}") from e
+        finally:
+            # Touched files may keep their size and land within mtime granularity
+            for line in patch_text.splitlines():
+                if line.startswith('+++ ') and not line.startswith('+++ /dev/null'):
+                    target = line[4:].split('\t', 1)[0]
+                    if target.startswith('b/'):
+                        target = target[2:]
+                    VcsManager.invalidate(str(Path(code_dir) / target))
 
     @staticmethod
     def reset(code_dir: str) -> None:
@@ -15,6 +15,6 @@ class ProblemIdentificationRole(Role):
         prompt = self.prompt_template.format(goal_description=goal_desc)
         response = self.model_client.chat(prompt)
         # Assuming response is a newline-delimited list of tasks
-        todos = [line.strip() for line in response.splitlines() if line.strip()]
-        context.todos = todos
+        # One strip() per line, keeping splitlines()' notion of a line break
+        context.todos = [todo for line in response.splitlines() if (todo := line.strip())]
         return context
@@ -1,7 +1,23 @@
 # roles/self_review.py
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 from ..engine import Role, Context
+import functools
 import importlib
+import sys
+
+@functools.lru_cache(maxsize=None)
+def _cached_import(module_name: str, attr: str) -> Any:
+    """Import module_name and return its attr, resolving each pair only once."""
+    module = sys.modules.get(module_name) or importlib.import_module(module_name)
+    return getattr(module, attr)
+
+@functools.lru_cache(maxsize=None)
+def _optional_import(module_name: str, attr: str) -> Optional[Any]:
+    """Like _cached_import, but remembers a missing module/attr as None."""
+    try:
+        return _cached_import(module_name, attr)
+    except (ImportError, AttributeError):
+        return None
 
 class SelfReviewRole(Role):
     """
@@ -10,16 +26,12 @@ class SelfReviewRole(Role):
     """
     def __init__(self, rule_config: Dict[str, Any] = None, analyzer_config: Dict[str, Any] = None):
         # Dynamically load the original RuleEngine from god_engine
-        module = importlib.import_module('god_engine.rule_engine')
-        RuleEngine = getattr(module, 'RuleEngine')
+        RuleEngine = _cached_import('god_engine.rule_engine', 'RuleEngine')
         # Initialize with the same config dict schema
         self.rule_engine = RuleEngine(rule_config or {})
         # Optionally load review_analyzer
-        try:
-            analyzer_mod = importlib.import_module('review_analyzer')
-            self.analyzer = getattr(analyzer_mod, 'ReviewAnalyzer')(analyzer_config or {})
-        except (ImportError, AttributeError):
-            self.analyzer = None
+        ReviewAnalyzer = _optional_import('review_analyzer', 'ReviewAnalyzer')
+        self.analyzer = ReviewAnalyzer(analyzer_config or {}) if ReviewAnalyzer else None
 
     def run(self, context: Context) -> Context:
         # 1. Evaluate tests
@@ -33,7 +45,7 @@ class SelfReviewRole(Role):
             )
         except Exception as e:
             # If rule evaluation fails, decline by default
-            context.metadata.setdefault('errors', []).append(f"RuleEngine error: {e}")
+            context.errors.append(f"RuleEngine error: {e!r}")
             accepted = False
 
         context.accepted = bool(accepted)
@@ -47,7 +59,7 @@ class SelfReviewRole(Role):
                 )
                 context.metadata['analysis'] = analysis
             except Exception as e:
-                context.metadata.setdefault('errors', []).append(f"Analyzer error: {e}")
+                context.errors.append(f"Analyzer error: {e!r}")
 
         # 4. Set abort flag on rejection
         if not context.accepted:
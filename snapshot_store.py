@@ -1,7 +1,16 @@
 # goal_manager.py
+import copy
 import json
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# (path, st_mtime_ns) -> parsed goals; goal files rarely change between engine starts
+_GOALS_CACHE: Dict[Tuple[str, int], List[Dict[str, Any]]] = {}
 
 class GoalManager:
     """
@@ -13,14 +22,24 @@ class GoalManager:
         self.index = 0
 
     def _load_goals(self) -> List[Dict[str, Any]]:
-        # Supports JSON or YAML based on file extension
-        if self.goals_path.suffix in ['.yaml', '.yml']:
-            import yaml
-            with open(self.goals_path, 'r') as f:
-                return yaml.safe_load(f)
-        else:
-            with open(self.goals_path, 'r') as f:
-                return json.load(f)
+        key = (str(self.goals_path.resolve()), self.goals_path.stat().st_mtime_ns)
+        goals = _GOALS_CACHE.get(key)
+        if goals is None:
+            # Goal files are small: slurp the bytes once, then parse from memory
+            with open(self.goals_path, 'rb') as f:
+                raw = f.read()
+            # Supports JSON or YAML based on file extension
+            if self.goals_path.suffix in ['.yaml', '.yml']:
+                import yaml
+                goals = yaml.load(raw, Loader=getattr(yaml, 'CSafeLoader', yaml.SafeLoader))
+            elif orjson is not None:
+                goals = orjson.loads(raw)
+            else:
+                goals = json.loads(raw)
+            _GOALS_CACHE[key] = goals
+        # Each manager gets its own copy so sibling managers don't share state:
+        # goal dicts end up in Context.goal, where roles may mutate them
+        return copy.deepcopy(goals)
 
     def next_goal(self) -> Optional[Dict[str, Any]]:
         if self.index < len(self.goals):
@@ -37,32 +56,66 @@ class GoalManager:
         return self.goals
 
 # snapshot_store.py
+import hashlib
 import os
 import json
 from pathlib import Path
-from typing import Any
+from typing import Any, Dict, Iterator, Tuple
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+_SUFFIX = '.json'
+_ENCODER = json.JSONEncoder(separators=(",", ":"))
+
+def _iter_value(value: Any) -> Iterator[bytes]:
+    """Encode one value; the json fallback streams it in iterencode chunks."""
+    if orjson is not None:
+        yield orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS)
+        return
+    for chunk in _ENCODER.iterencode(value):
+        yield chunk.encode('utf-8')
+
+def _iter_snapshot(data: Dict[str, Any]) -> Iterator[bytes]:
+    """Encode a snapshot one top-level field at a time, never as a whole."""
+    yield b'{'
+    for i, (key, value) in enumerate(data.items()):
+        if i:
+            yield b','
+        yield from _iter_value(key)
+        yield b':'
+        yield from _iter_value(value)
+    yield b'}'
 
 class SnapshotStore:
     """
     Manages recording and retrieval of engine snapshots (contexts) to a filesystem directory.
     """
+    __slots__ = ('memory_path', '_memory_dir', '_written')
+
     def __init__(self, memory_path: str):
         self.memory_path = Path(memory_path)
         self.memory_path.mkdir(parents=True, exist_ok=True)
+        # Plain-string twin of memory_path for the per-call path joins below
+        self._memory_dir = str(self.memory_path)
+        # goal_id -> (content digest, st_mtime_ns, st_size) of the last file we wrote
+        self._written: Dict[str, Tuple[bytes, int, int]] = {}
 
     def has(self, goal: Any) -> bool:
         """
         Check if a snapshot for this goal ID already exists.
         """
         goal_id = self._get_goal_id(goal)
-        return (self.memory_path / f"{goal_id}.json").exists()
+        return os.path.exists(os.path.join(self._memory_dir, goal_id + _SUFFIX))
 
     def record(self, context: Any) -> None:
         """
         Serialize the context to a JSON file under memory_path.
         """
         goal_id = self._get_goal_id(context.goal)
-        snapshot_file = self.memory_path / f"{goal_id}.json"
+        snapshot_file = os.path.join(self._memory_dir, goal_id + _SUFFIX)
         data = {
             'goal': context.goal,
             'todos': context.todos,
@@ -70,23 +123,57 @@ class SnapshotStore:
             'test_results': context.test_results,
             'accepted': context.accepted,
             'metadata': context.metadata,
+            # Role failures collected during the cycle (Context.errors)
+            'errors': getattr(context, 'errors', []),
         }
-        with open(snapshot_file, 'w') as f:
-            json.dump(data, f, indent=2)
+        # Encode once, hashing the chunks as they are written aside. Streaming
+        # one top-level field at a time keeps peak memory at the largest field
+        # (usually the patch), not the whole serialized snapshot.
+        tmp_file = snapshot_file + '.tmp'
+        digest = hashlib.blake2b(digest_size=16)
+        with open(tmp_file, 'wb') as f:
+            for chunk in _iter_snapshot(data):
+                digest.update(chunk)
+                f.write(chunk)
+            f.flush()
+            st = os.fstat(f.fileno())
+        digest = digest.digest()
+        # Re-recording an unchanged context leaves the snapshot alone, provided
+        # the file on disk is still the one we wrote
+        last = self._written.get(goal_id)
+        if last is not None and last[0] == digest:
+            try:
+                current = os.stat(snapshot_file)
+            except FileNotFoundError:
+                pass
+            else:
+                if (current.st_mtime_ns, current.st_size) == last[1:]:
+                    os.remove(tmp_file)
+                    return
+
+        os.replace(tmp_file, snapshot_file)
+        self._written[goal_id] = (digest, st.st_mtime_ns, st.st_size)
 
     def load(self, goal: Any) -> Any:
         """
         Load a recorded context for the given goal.
         """
         goal_id = self._get_goal_id(goal)
-        snapshot_file = self.memory_path / f"{goal_id}.json"
-        if snapshot_file.exists():
-            with open(snapshot_file, 'r') as f:
-                return json.load(f)
-        return None
+        snapshot_file = os.path.join(self._memory_dir, goal_id + _SUFFIX)
+        try:
+            f = open(snapshot_file, 'rb', buffering=0)
+        except FileNotFoundError:
+            return None
+        with f:
+            raw = f.read()  # single fstat-sized readall
+        return orjson.loads(raw) if orjson is not None else json.loads(raw)
 
     def _get_goal_id(self, goal: Any) -> str:
-        # Assumes goal has an 'id' attribute or key
-        if isinstance(goal, dict):
+        # Assumes goal has an 'id' attribute or key; goals are usually dicts,
+        # so try the subscript first and only fall back on failure
+        try:
+            return str(goal['id'])
+        except KeyError:
             return str(goal.get('id'))
-        return str(getattr(goal, 'id', goal))
+        except TypeError:
+            return str(getattr(goal, 'id', goal))
@@ -1,40 +1,116 @@
 import argparse
+import atexit
+import copy
+import functools
+import hashlib
 import json  # New import for JSON formatter
 import logging  # New import
+import logging.handlers
 import os
+import queue
 import sys
-from datetime import datetime  # New import for JSON formatter
+import time
 from pathlib import Path
+from typing import TYPE_CHECKING, Dict, Optional, Tuple
 
-import yaml
-from pydantic import ValidationError  # Import ValidationError
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
-from .config import LoggingConfig, MainConfig
-from .core.engine import Engine
+if orjson is not None:
+    def _dumps_log(log_record: dict) -> str:
+        return orjson.dumps(log_record).decode()
+else:
+    _dumps_log = json.dumps
+
+# Module global so tests can patch it; test_utils imports subprocess lazily
+from .test_utils import run_tests_with_coverage
+
+# yaml, pydantic, typer, subprocess and the engine are imported where they are
+# used so `--help` and argument errors only pay for argparse.
+if TYPE_CHECKING:
+    from .config import LoggingConfig, MainConfig
 
 # Set up a logger for the CLI module
 logger = logging.getLogger(__name__)
 
+
+# Background thread that owns the console/file handlers; see _setup_logging
+_queue_listener = None
+# The root logger handler feeding _queue_listener
+_queue_handler = None
+
+class _LocalQueueHandler(logging.handlers.QueueHandler):
+    """
+    QueueHandler for a listener in the same process. The stock prepare() formats
+    the record and drops exc_info/stack_info for pickling; here only the %-args
+    are resolved, so the sink formatters (e.g. JsonFormatter) still see them.
+    """
+    def prepare(self, record):
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+def _stop_queue_listener():
+    """Drains queued records, stops the logging thread and detaches its queue handler."""
+    global _queue_listener, _queue_handler
+    if _queue_handler is not None:
+        # Later records would otherwise pile up in a queue nobody reads
+        logging.getLogger().removeHandler(_queue_handler)
+        _queue_handler = None
+    if _queue_listener is not None:
+        _queue_listener.stop()
+        _queue_listener = None
+
 class JsonFormatter(logging.Formatter):
     """A custom logging formatter that outputs logs in JSON format."""
+    _last_second = None
+    _last_prefix = ""
+
+    def _timestamp(self, record) -> str:
+        """Local ISO-8601 time with milliseconds; the seconds part is formatted once per second."""
+        second = int(record.created)
+        if second != self._last_second:
+            self._last_prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(second))
+            self._last_second = second
+        return "%s.%03d" % (self._last_prefix, record.msecs)
+
     def format(self, record):
         log_record = {
-            "timestamp": datetime.fromtimestamp(record.created).isoformat(),
+            "timestamp": self._timestamp(record),
             "level": record.levelname,
             "name": record.name,
             "message": record.getMessage(),
         }
-        if record.exc_info:
-            log_record["exc_info"] = self.formatException(record.exc_info)
-        if record.stack_info:
-            log_record["stack_info"] = self.formatStack(record.stack_info)
-
-        return json.dumps(log_record)
+        goal_id = record.__dict__.get("goal_id")  # set via extra= by the engine
+        if goal_id is not None:
+            log_record["goal_id"] = goal_id
+        exc_info, stack_info = record.exc_info, record.stack_info
+        if exc_info or stack_info:  # rare; the common record is the four fields above
+            if exc_info:
+                log_record["exc_info"] = self.formatException(exc_info)
+            if stack_info:
+                log_record["stack_info"] = self.formatStack(stack_info)
+        return _dumps_log(log_record)
 
-def _setup_logging(log_config: LoggingConfig):
+def _setup_logging(log_config: "LoggingConfig"):
     """Configures the root logger based on the provided logging configuration."""
-    level_map = {level: getattr(logging, level.upper()) for level in ["debug", "info", "warning", "error", "critical"]}
-    log_level = level_map.get(log_config.level.lower(), logging.INFO)
+    level = log_config.level
+    if isinstance(level, str):
+        if hasattr(logging, "getLevelNamesMapping"):  # Python 3.11+
+            log_level = logging.getLevelNamesMapping().get(level.upper(), logging.INFO)
+        else:
+            # Returns the number for a known name, "Level X" otherwise
+            log_level = logging.getLevelName(level.upper())
+            if not isinstance(log_level, int):
+                log_level = logging.INFO
+    else:
+        log_level = int(level)
+
+    global _queue_listener, _queue_handler
+    _stop_queue_listener()
 
     root_logger = logging.getLogger()
     root_logger.setLevel(log_level)
@@ -51,7 +127,7 @@ def _setup_logging(log_config: LoggingConfig):
         formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(name)s - %(message)s')
 
     console_handler.setFormatter(formatter)
-    root_logger.addHandler(console_handler)
+    handlers = [console_handler]
 
     # File handler (if log_file is specified)
     if log_config.log_file:
@@ -60,11 +136,94 @@ def _setup_logging(log_config: LoggingConfig):
         file_handler = logging.FileHandler(log_file_path, encoding='utf-8')
         file_handler.setLevel(log_level)
         file_handler.setFormatter(formatter)
-        root_logger.addHandler(file_handler)
+        handlers.append(file_handler)
+
+    # Logging calls only enqueue; the listener thread formats and writes
+    log_queue = queue.SimpleQueue()
+    _queue_handler = _LocalQueueHandler(log_queue)
+    root_logger.addHandler(_queue_handler)
+    _queue_listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _queue_listener.start()
 
     logger.info("Logging configured to level '%s' with format '%s'. Outputting to console and %s.", 
                 log_config.level, log_config.format, log_config.log_file if log_config.log_file else "console only")
 
+atexit.register(_stop_queue_listener)
+
+# (absolute path, st_mtime_ns, st_size) -> validated config, for repeated
+# in-process loads (tests, programmatic callers). Treat entries as read-only.
+_CONFIG_CACHE: Dict[Tuple[str, int, int], "MainConfig"] = {}
+
+def _config_cache_path(abs_config_path: str) -> Path:
+    """Where the validated copy of a config file is cached, under the user's cache dir."""
+    cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    digest = hashlib.blake2b(abs_config_path.encode(), digest_size=16).hexdigest()
+    return Path(cache_home, "ai_self_ext_engine", "config", digest + ".json")
+
+@functools.lru_cache(maxsize=None)
+def _config_schema_digest() -> str:
+    """
+    Fingerprint of the MainConfig schema; field, default or validator changes
+    invalidate cached configs. Hashes config.py's source, which is much
+    cheaper than building MainConfig.model_json_schema() on every start.
+    """
+    from . import config
+
+    try:
+        with open(config.__file__, 'rb') as f:
+            source = f.read()
+    except (OSError, TypeError):  # no readable source, e.g. a zipped install
+        source = json.dumps(config.MainConfig.model_json_schema(), sort_keys=True).encode()
+    return hashlib.blake2b(source, digest_size=16).hexdigest()
+
+def _load_config(config_path: Path) -> "MainConfig":
+    """
+    Loads and validates the YAML config, reusing a JSON cache of the validated
+    result (see _config_cache_path) while the YAML file's mtime and size, the
+    package version and the MainConfig schema are unchanged.
+    Within a process the validated object itself is memoized in _CONFIG_CACHE.
+    """
+    import yaml
+    from pydantic import ValidationError
+
+    from . import __version__
+    from .config import MainConfig, load_config
+
+    st = config_path.stat()
+    abs_path = os.path.abspath(config_path)
+    memo_key = (abs_path, st.st_mtime_ns, st.st_size)
+    config = _CONFIG_CACHE.get(memo_key)
+    if config is not None:
+        return config
+
+    # The schema digest also catches MainConfig edits in an editable checkout,
+    # where the version stays the same
+    stamp = f"{__version__}:{_config_schema_digest()}:{abs_path}:{st.st_mtime_ns}:{st.st_size}\n".encode()
+    cache_path = _config_cache_path(abs_path)
+    try:
+        cached = cache_path.read_bytes()
+        if cached.startswith(stamp):
+            # Single Rust-side parse + validate; skips YAML and dict building
+            config = _CONFIG_CACHE[memo_key] = MainConfig.model_validate_json(cached[len(stamp):])
+            return config
+    except (OSError, ValidationError):
+        pass  # Missing, stale or unreadable cache: fall through to a full load
+
+    with open(config_path, 'rb') as f:
+        config_data = yaml.load(f, Loader=getattr(yaml, 'CSafeLoader', yaml.SafeLoader))
+    config = _CONFIG_CACHE[memo_key] = load_config(config_data) # Use MainConfig for validation
+
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+        # Only what the YAML set: defaults are filled in again on load, so a
+        # changed default is never served from the cache
+        tmp_path.write_bytes(stamp + config.model_dump_json(by_alias=True, exclude_unset=True).encode())
+        os.replace(tmp_path, cache_path)  # atomic: readers never see a torn cache
+    except OSError as e:
+        logger.debug("Could not write config cache %s: %s", cache_path, e)
+    return config
+
 def main():
     parser = argparse.ArgumentParser(description="AI Self-Extending Engine")
     parser.add_argument("--config", type=str, default="config/engine_config.yaml",
@@ -73,21 +232,23 @@ def main():
                         help="Enable verbose logging (DEBUG level). Overrides config.")
     args = parser.parse_args()
 
+    from pydantic import ValidationError
+
+    from .core.engine import Engine
+
     # Load and validate configuration
-    config: MainConfig
+    config: "MainConfig"
     try:
         config_path = Path(args.config)
         if not config_path.exists():
             raise FileNotFoundError(f"Config file not found at {config_path.absolute()}")
         
-        with open(config_path, 'r', encoding='utf-8') as f:
-            config_data = yaml.safe_load(f)
-        
-        config = MainConfig(**config_data) # Use MainConfig for validation
+        config = _load_config(config_path)
 
         # Override log level if --verbose flag is set
         if args.verbose:
-            config.logging.level = "DEBUG"
+            # Copy rather than mutate: the loaded config is shared via _CONFIG_CACHE
+            config = config.model_copy(update={"logging": config.logging.model_copy(update={"level": "DEBUG"})})
 
         # Configure logging as early as possible after config is loaded
         _setup_logging(config.logging)
@@ -105,10 +266,12 @@ def main():
     engine = Engine(config)
     engine.run_cycles()
 
-# AI-generated improvements:
-import subprocess  # New import for running external commands
-
+def _forward_lines(stream, level: int, fmt: str) -> None:
+    """Logs each line of a text stream as it arrives."""
+    for line in stream:
+        logger.log(level, fmt, line.rstrip("\n"))
 
+# AI-generated improvements:
 def _run_tests_with_coverage(test_target: str, config_file_path: Path) -> int:
     """
     Runs pytest with coverage and generates reports.
@@ -119,6 +282,9 @@ def _run_tests_with_coverage(test_target: str, config_file_path: Path) -> int:
     Returns:
         The exit code of the pytest process.
     """
+    import subprocess
+    import threading
+
     try:
         # Determine the base directory for reports (project root, assuming config is in <project_root>/config/)
         project_root_for_reports = config_file_path.parent.parent
@@ -138,12 +304,19 @@ def _run_tests_with_coverage(test_target: str, config_file_path: Path) -> int:
             "--durations=0",
         ]
         logger.info("Running tests with coverage: %s", " ".join(cmd))
-        process = subprocess.run(cmd, capture_output=True, text=True, check=False)
-        if process.stdout: logger.info("Pytest Output:\n%s", process.stdout)
-        if process.stderr: logger.error("Pytest Errors:\n%s", process.stderr)
+        # Forward output line by line as it arrives instead of buffering the
+        # whole run; one thread per pipe so neither can fill up and stall pytest
+        with subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                              text=True, bufsize=1) as process:
+            stderr_thread = threading.Thread(
+                target=_forward_lines, args=(process.stderr, logging.ERROR, "Pytest Errors: %s"), daemon=True)
+            stderr_thread.start()
+            _forward_lines(process.stdout, logging.INFO, "Pytest Output: %s")
+            stderr_thread.join()
+            returncode = process.wait()
         logger.info("Coverage XML report generated at: %s", coverage_xml_path.absolute())
         logger.info("Coverage HTML report generated at: %s", coverage_html_dir.absolute())
-        return process.returncode
+        return returncode
     except FileNotFoundError:
         logger.error("Error: 'pytest' or 'python' command not found. Please ensure pytest and pytest-cov are installed (`pip install pytest pytest-cov`).")
         return 1
@@ -159,73 +332,90 @@ def _run_tests_with_coverage(test_target: str, config_file_path: Path) -> int:
         exit_code = _run_tests_with_coverage(args.test, config_path)
         sys.exit(exit_code)
 
-from typing import Optional
+_app = None
 
-# AI-generated improvements:
-import typer
-from src.ai_self_ext_engine.test_utils import run_tests_with_coverage
+def _get_typer_app():
+    """Builds the Typer app on first use so importing cli doesn't import typer."""
+    global _app
+    if _app is None:
+        import typer
 
-app = typer.Typer()
-logger = logging.getLogger(__name__)
-@app.command(name="test", help="Run unit tests and generate a comprehensive code coverage report.")
-def run_tests_command(
-    tests_path: Optional[Path] = typer.Argument(
-        None,
-        help="Path to tests (file or directory). Defaults to 'tests' directory if exists.",
-        exists=True,
-        file_okay=True,
-        dir_okay=True,
-        readable=True,
-    ),
-    coverage_report_dir: Path = typer.Option(
-        Path("coverage_reports"),
-        "--coverage-report-dir",
-        "-crd",
-        help="Directory to save the code coverage XML report.",
-        writable=True,
-    ),
-    project_root: Path = typer.Option(
-        Path("."),
-        "--project-root",
-        "-pr",
-        help="The root directory of the project for coverage measurement.",
-        exists=True,
-        dir_okay=True,
-        readable=True,
-    ),
-):
-    """
-    Runs unit tests and generates a comprehensive code coverage report.
-    """
-    if tests_path is None:
-        # Prioritize 'tests' in project root, then 'src/ai_self_ext_engine/tests', then 'src/tests'
-        if (project_root / "tests").is_dir():
-            tests_path = project_root / "tests"
-        elif (project_root / "src" / "ai_self_ext_engine" / "tests").is_dir():
-             tests_path = project_root / "src" / "ai_self_ext_engine" / "tests"
-        elif (project_root / "src" / "tests").is_dir():
-             tests_path = project_root / "src" / "tests"
+        _app = typer.Typer()
+        # A callback keeps `test` a subcommand; a lone command becomes the app
+        _app.callback()(lambda: None)
+        _app.command(name="test", help="Run unit tests and generate a comprehensive code coverage report.")(
+            _build_run_tests_command(typer)
+        )
+    return _app
+
+def __getattr__(name):
+    # Keeps `from ai_self_ext_engine.cli import app` working with the lazy app
+    if name == "app":
+        return _get_typer_app()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+def _build_run_tests_command(typer):
+    """Defines the `test` command; typer is passed in so it is imported lazily."""
+    def run_tests_command(
+        tests_path: Optional[Path] = typer.Argument(
+            None,
+            help="Path to tests (file or directory). Defaults to 'tests' directory if exists.",
+            exists=True,
+            file_okay=True,
+            dir_okay=True,
+            readable=True,
+        ),
+        coverage_report_dir: Path = typer.Option(
+            Path("coverage_reports"),
+            "--coverage-report-dir",
+            "-crd",
+            help="Directory to save the code coverage XML report.",
+            writable=True,
+        ),
+        project_root: Path = typer.Option(
+            Path("."),
+            "--project-root",
+            "-pr",
+            help="The root directory of the project for coverage measurement.",
+            exists=True,
+            dir_okay=True,
+            readable=True,
+        ),
+    ):
+        """
+        Runs unit tests and generates a comprehensive code coverage report.
+        """
+        if tests_path is None:
+            # Prioritize 'tests' in project root, then 'src/ai_self_ext_engine/tests', then 'src/tests'
+            if (project_root / "tests").is_dir():
+                tests_path = project_root / "tests"
+            elif (project_root / "src" / "ai_self_ext_engine" / "tests").is_dir():
+                 tests_path = project_root / "src" / "ai_self_ext_engine" / "tests"
+            elif (project_root / "src" / "tests").is_dir():
+                 tests_path = project_root / "src" / "tests"
+            else:
+                typer.echo("No specific tests path provided and no 'tests' directory found in common locations. Please specify with 'ai-self-ext-engine test PATH_TO_TESTS'", err=True)
+                raise typer.Exit(code=1)
+        typer.echo(f"Running tests from: {tests_path.resolve()}")
+        typer.echo(f"Generating coverage report in: {coverage_report_dir.resolve()}")
+        coverage_report_dir.mkdir(parents=True, exist_ok=True)
+        results = run_tests_with_coverage(project_root=project_root, test_path=tests_path, coverage_report_dir=coverage_report_dir)
+        if results['success']:
+            typer.echo("\nTests completed successfully.")
+            if results.get('coverage_xml_path'):
+                typer.echo(f"Code coverage report generated at: {results['coverage_xml_path'].resolve()}")
+                if results.get('coverage_data'):
+                    typer.echo("Coverage Summary:")
+                    for metric, value in results['coverage_data'].items():
+                        typer.echo(f"  {metric.replace('_', ' ').title()}: {value}")
+            raise typer.Exit(code=0)
         else:
-            logger.error("No specific tests path provided and no 'tests' directory found in common locations. Please specify with 'ai-self-ext-engine test PATH_TO_TESTS'")
+            typer.echo("\nTests failed!", err=True)
+            typer.echo(f"Stdout:\n{results['stdout']}", err=True)
+            typer.echo(f"Stderr:\n{results['stderr']}", err=True)
             raise typer.Exit(code=1)
-    logger.info(f"Running tests from: {tests_path.resolve()}")
-    logger.info(f"Generating coverage report in: {coverage_report_dir.resolve()}")
-    coverage_report_dir.mkdir(parents=True, exist_ok=True)
-    results = run_tests_with_coverage(project_root=project_root, test_path=tests_path, coverage_report_dir=coverage_report_dir)
-    if results['success']:
-        logger.info(f"\nTests completed successfully.")
-        if results.get('coverage_xml_path'):
-            logger.info(f"Code coverage report generated at: {results['coverage_xml_path'].resolve()}")
-            if results.get('coverage_data'):
-                logger.info(f"Coverage Summary:")
-                for metric, value in results['coverage_data'].items():
-                    logger.info(f"  {metric.replace('_', ' ').title()}: {value}")
-        raise typer.Exit(code=0)
-    else:
-        logger.error(f"\nTests failed!")
-        logger.error(f"Stdout:\n{results['stdout']}")
-        logger.error(f"Stderr:\n{results['stderr']}")
-        raise typer.Exit(code=1)
+
+    return run_tests_command
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -12,6 +12,8 @@ class CodeSynthesizer:
     A module responsible for synthesizing initial code improvements or patches
     based on a given goal and the current codebase.
     """
+    __slots__ = ("config", "model_client", "PROMPT_TEMPLATE", "_prompt_pre", "_prompt_mid", "_prompt_post")
+
     def __init__(self, config: MainConfig, model_client: ModelClient):
         self.config = config
         self.model_client = model_client
@@ -34,6 +36,10 @@ Current Codebase:
 Based on the Goal, generate a unified diff patch to improve the Current Codebase. Focus on the core change needed to address the goal.
 Do not include any conversational text or explanations. Provide only the patch.
 """
+        # Static text around the two fields; prompts are joined, not format()-ed,
+        # so a large current_code is copied once and never brace-scanned
+        self._prompt_pre, rest = self.PROMPT_TEMPLATE.split("{goal_description}")
+        self._prompt_mid, self._prompt_post = rest.split("{current_code}")
 
     def synthesize_initial_patch(self, goal_description: str, current_code: str) -> Optional[str]:
         """
@@ -44,53 +50,26 @@ Do not include any conversational text or explanations. Provide only the patch.
             current_code: The concatenated content of the current codebase files.
 
         Returns:
-            A unified diff patch string, or None if an error occurred or no patch was generated.
+            A unified diff patch string, "" if the model proposed no change, or None
+            if the model call failed or the response was not a patch.
         """
         logger.info("CodeSynthesizer: Synthesizing initial patch for goal: '%s'", goal_description)
 
+        prompt = self._construct_prompt(goal_description, current_code)
         try:
-            prompt = self.PROMPT_TEMPLATE.format(
-                goal_description=goal_description,
-                current_code=current_code
-            )
-
-            response_text = self.model_client.call_model(
-                model_name=self.config.model.model_name,
-                prompt=prompt
-            ).strip()
-
-            if response_text.startswith("---"):
-                logger.debug("CodeSynthesizer: Successfully synthesized an initial patch.")
-                return response_text
-            elif not response_text:
-                logger.warning("CodeSynthesizer: Empty response received from model")
-                return ""
-            else:
-                logger.warning("CodeSynthesizer: Response does not start with expected format")
-                return response_text
-                
-        except Exception as e:
-            logger.error("CodeSynthesizer: Error during patch synthesis: %s", e)
-            return ""
-
-# AI-generated improvements:
-            prompt = self._construct_prompt(goal_description, current_code)
             response_text = self._call_model_for_patch(prompt)
-            return self._process_model_response(response_text)
         except ModelCallError as e:
             logger.error("CodeSynthesizer: Model call error during patch synthesis: %s", e)
             return None  # Indicate failure to generate a patch due to model error
-        except Exception as e: # Catch any other unexpected errors
-            logger.error("CodeSynthesizer: Unexpected error during patch synthesis: %s", e)
-            return None  # Indicate failure to generate a patch due to an unexpected error
+        return self._process_model_response(response_text)
+
     def _construct_prompt(self, goal_description: str, current_code: str) -> str:
         """
         Constructs the prompt for the model based on the goal and current code.
         """
-        return self.PROMPT_TEMPLATE.format(
-            goal_description=goal_description,
-            current_code=current_code
-        )
+        return "".join((self._prompt_pre, goal_description, self._prompt_mid,
+                        current_code, self._prompt_post))
+
     def _call_model_for_patch(self, prompt: str) -> str:
         """
         Calls the model client to generate a patch and returns the raw response.
@@ -101,6 +80,7 @@ Do not include any conversational text or explanations. Provide only the patch.
             model_name=self.config.model.model_name,
             prompt=prompt
         ).strip()
+
     def _process_model_response(self, response_text: str) -> Optional[str]:
         """
         Processes the model's raw response to validate and return the patch.
@@ -119,4 +99,4 @@ Do not include any conversational text or explanations. Provide only the patch.
             # Log the unexpected response and return None to indicate failure to get a valid patch.
             logger.warning("CodeSynthesizer: Model response did not start with expected '---' for a patch. "
                            "Treating as invalid patch format. Response (first 200 chars): '%s'", response_text[:200])
-            return None
\ No newline at end of file
+            return None
@@ -1,29 +1,42 @@
-from typing import Any, Dict, List, Literal, Optional
+from typing import Any, Dict, List, Literal, Optional, Union
 
-from pydantic import BaseModel, Field, ValidationError, validator
+from pydantic import BaseModel, ConfigDict, Field, ValidationError
 
 
 class EngineSectionConfig(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     code_dir: str = Field("./src", description="Path to the codebase directory relative to project root.")
-    max_cycles: int = Field(3, description="Maximum number of improvement cycles to run.")
+    max_cycles: int = Field(3, gt=0, description="Maximum number of improvement cycles to run.")
     memory_path: str = Field("./memory", description="Path to the memory/snapshot directory relative to project root.")
     goals_path: str = Field("goals.json", description="Path to the goals file.")
     prompts_dir: str = Field("prompts", description="Directory containing prompt templates, relative to project root.")
+    max_concurrent_roles: int = Field(1, gt=0, description="Upper bound on roles running at once; only used when some role sets depends_on. Overlapping roles share one Context, so they must not write the same fields.")
+    max_concurrent_goals: int = Field(1, gt=0, description="Number of goals worked on at once; 1 processes goals one after another. Above 1, every role class must set concurrent_goals_safe = True.")
 
 class ModelSectionConfig(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     api_key_env: str = Field(..., description="Environment variable name for the API key.")
     model_name: str = Field("gemini-2.5-flash", description="Default model name to use.")
 
 class RoleConfig(BaseModel):
+    model_config = ConfigDict(frozen=True, populate_by_name=True) # Allow class_name as well as 'class'
+
     module: str = Field(..., description="Module path for the role, e.g., 'roles.problem_identification'.")
     class_name: str = Field(..., alias='class', description="Class name of the role within the module, e.g., 'ProblemIdentificationRole'.")
     prompt_path: str = Field(..., description="Path to the prompt template file relative to prompts_dir.")
+    depends_on: Optional[List[str]] = Field(None, description="Class names of roles that must finish before this one; defaults to the previous role.")
 
 class PluginConfig(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     entry_point: str = Field(..., description="Full import path to the plugin class, e.g., 'plugins.python.PythonPlugin'.")
 
 class LoggingConfig(BaseModel):
-    level: str = Field("INFO", description="Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL).")
+    model_config = ConfigDict(frozen=True)
+
+    level: Union[str, int] = Field("INFO", description="Logging level name (DEBUG, INFO, WARNING, ERROR, CRITICAL) or number.")
     format: str = Field("json", description="Logging output format (json or plain).")
     log_file: Optional[str] = Field(None, description="Optional path to a log file. If not provided, logs go to stderr.")
 
@@ -31,6 +44,9 @@ class MainConfig(BaseModel):
     """
     Main configuration schema for the AI Self-Extending Engine.
     """
+    # Frozen: loaded configs are memoized and shared, see cli._CONFIG_CACHE
+    model_config = ConfigDict(frozen=True)
+
     version: Literal[1] = Field(1, description="Version of the configuration schema.")
     engine: EngineSectionConfig = Field(..., description="Engine core settings.")
     model: ModelSectionConfig = Field(..., description="Model client settings.")
@@ -38,11 +54,10 @@ class MainConfig(BaseModel):
     plugins: Dict[str, PluginConfig] = Field({}, description="Dictionary of plugins, keyed by name.")
     logging: LoggingConfig = Field(..., description="Logging configuration.")
 
-    @validator('engine')
-    def validate_engine_max_cycles(cls, v):
-        if v.max_cycles <= 0:
-            raise ValueError('engine.max_cycles must be a positive integer')
-        return v
+# Bound once at import: load_config skips BaseModel.__init__'s kwargs round
+# trip and calls pydantic-core directly with the raw (e.g. YAML) mapping.
+_MAIN_CONFIG_VALIDATOR = MainConfig.__pydantic_validator__
 
-    class Config:
-        validate_by_name = True # Allow 'class' to be used in RoleConfig
+def load_config(raw: Dict[str, Any]) -> MainConfig:
+    """Validates a raw config mapping into a MainConfig."""
+    return _MAIN_CONFIG_VALIDATOR.validate_python(raw)
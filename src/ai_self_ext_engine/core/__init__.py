@@ -1,8 +1,24 @@
 # src/core/__init__.py
 
-from .engine import Engine
 from .role import Context, Role, RoleType # Context is defined in role.py, not engine.py
 from .plugin import Plugin
-# GoalManager is not exposed directly in __init__.py, but Goal is
-from ..goal_manager import Goal
-from ..model_client import ModelClient, ModelCallError
+
+# Engine, Goal and the model client pull in most of the package; resolve them
+# on first access (PEP 562) so importing core.role stays cheap.
+_LAZY_ATTRS = {
+    "Engine": (".engine", "Engine"),
+    # GoalManager is not exposed directly in __init__.py, but Goal is
+    "Goal": ("..goal_manager", "Goal"),
+    "ModelClient": ("..model_client", "ModelClient"),
+    "ModelCallError": ("..model_client", "ModelCallError"),
+}
+
+def __getattr__(name):
+    try:
+        module_path, attr = _LAZY_ATTRS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    from importlib import import_module
+    value = getattr(import_module(module_path, __name__), attr)
+    globals()[name] = value  # later lookups skip __getattr__
+    return value
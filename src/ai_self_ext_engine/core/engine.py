@@ -1,7 +1,12 @@
+import asyncio
 import logging
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from importlib import import_module
 from pathlib import Path
-from typing import Dict, List, cast
+from typing import Any, Callable, Dict, FrozenSet, List, Optional, Set, Tuple, cast
 
 from ..config import MainConfig, PluginConfig, RoleConfig
 from ..goal_manager import Goal, GoalManager
@@ -12,6 +17,46 @@ from .plugin import Plugin
 from .role import Context, Role
 
 
+@lru_cache(maxsize=None)
+def _resolve_class(module_path: str, class_name: str) -> Any:
+    """Imports module_path and returns its class_name attribute, memoized. Failures aren't cached."""
+    module = import_module(module_path)
+    return getattr(module, class_name)
+
+
+def _import_concurrently(module_paths: List[str]) -> None:
+    """
+    Imports not-yet-loaded modules on a small thread pool. The import lock
+    serializes module execution, but finding and reading the files overlaps.
+    Every import is waited for before the first failure, in module_paths
+    order, is logged and re-raised.
+    """
+    pending = [path for path in dict.fromkeys(module_paths) if path not in sys.modules]
+    if len(pending) < 2:
+        return
+    with ThreadPoolExecutor(max_workers=min(8, len(pending))) as executor:
+        futures = [(path, executor.submit(import_module, path)) for path in pending]
+    # Leaving the with block waited for all of them
+    for path, future in futures:
+        error = future.exception()
+        if error is not None:
+            Engine.logger.error("Error importing module '%s': %s", path, error, exc_info=error)
+            raise error
+
+
+def _in_event_loop() -> bool:
+    """True when called from a running event loop, where asyncio.run() raises."""
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return False
+    return True
+
+
+# (role name, bound run) pairs, in configured order
+_RoleDispatch = Tuple[Tuple[str, Callable[[Context], Context]], ...]
+
+
 class Engine:
     """
     Orchestrates the self-improvement process, managing cycles,
@@ -27,17 +72,31 @@ class Engine:
             config: Main configuration object containing engine settings, paths, and model configuration
         """
         self.config = config
-        self.goal_manager = GoalManager(self.config.engine.goals_path)
-        self.snapshot_store = SnapshotStore(self.config.engine.memory_path)
-        self.model_client = ModelClient(self.config.model)
-        self.learning_log = LearningLog(
-            Path(self.config.engine.memory_path) / "learning"
-        )
+        engine_config = config.engine
+        # Config is frozen, so these are resolved once. Contexts keep the str
+        # code_dir: roles forward it into JSON payloads and f-strings.
+        self._code_dir_str = engine_config.code_dir
+        self._code_dir = Path(engine_config.code_dir)
+        self._memory_path = Path(engine_config.memory_path)
+        self._max_cycles = engine_config.max_cycles
+        self.goal_manager = GoalManager(engine_config.goals_path)
+        self.snapshot_store = SnapshotStore(engine_config.memory_path)
+        self.model_client = ModelClient(config.model)
+        self.learning_log = LearningLog(self._memory_path / "learning")
 
         # Ensure core directories exist for the project structure
-        Path(self.config.engine.code_dir).mkdir(parents=True, exist_ok=True)
-
-        self.roles = self._load_roles(config.roles)
+        self._code_dir.mkdir(parents=True, exist_ok=True)
+
+        # Fixed for the engine's lifetime; the dispatch below is built from it
+        self.roles: Tuple[Role, ...] = tuple(self._load_roles(config.roles))
+        # (role name, bound run) pairs for _execute_roles
+        self._role_dispatch: Optional[_RoleDispatch] = None
+        # Per-role prerequisite indices when roles may run concurrently
+        self._role_graph: Optional[List[FrozenSet[int]]] = None
+        # Serializes goal status writes when engine.max_concurrent_goals > 1
+        # runs goals in worker threads; the snapshot store and learning log
+        # lock themselves
+        self._record_lock = threading.Lock()
         self.plugins = self._load_plugins(config.plugins)
 
     def _load_roles(self, role_configs: List[RoleConfig]) -> List[Role]:
@@ -49,15 +108,15 @@ class Engine:
         Returns:
             List of instantiated role objects ready for execution
         """
+        _import_concurrently([role_conf.module for role_conf in role_configs])
         loaded_roles: List[Role] = []
         for role_conf in role_configs:
             try:
-                module = import_module(role_conf.module)
-                role_class = getattr(module, role_conf.class_name)
-                # Pass learning_log to RefineRole, but not to others
-                if role_conf.class_name == "RefineRole":
+                role_class = _resolve_class(role_conf.module, role_conf.class_name)
+                # Roles declaring requires_learning_log also get self.learning_log
+                if getattr(role_class, "requires_learning_log", False):
                     loaded_roles.append(
-                        role_class(self.config, self.model_client, self.learning_log)
+                        role_class(self.config, self.model_client, learning_log=self.learning_log)
                     )
                 else:
                     loaded_roles.append(role_class(self.config, self.model_client))
@@ -82,12 +141,14 @@ class Engine:
         Returns:
             Dictionary mapping plugin names to instantiated plugin objects
         """
+        _import_concurrently(
+            [plugin_conf.entry_point.rsplit(".", 1)[0] for plugin_conf in plugin_configs.values()]
+        )
         loaded_plugins: Dict[str, Plugin] = {}
         for plugin_name, plugin_conf in plugin_configs.items():
             try:
                 module_path, class_name = plugin_conf.entry_point.rsplit(".", 1)
-                module = import_module(module_path)
-                plugin_class = getattr(module, class_name)
+                plugin_class = _resolve_class(module_path, class_name)
                 loaded_plugins[plugin_name] = plugin_class(self.config)
             except (ImportError, AttributeError, TypeError) as e:
                 self.logger.exception(
@@ -110,14 +171,93 @@ class Engine:
             None: This method runs until all goals are processed or autonomous generation fails
         """
         self.logger.info("Starting self-improvement engine cycles...")
+        self.warmup()
 
+        try:
+            # Called from a running loop (e.g. an MCP tool), goals run one
+            # after another rather than nesting asyncio.run()
+            if self.config.engine.max_concurrent_goals > 1 and not _in_event_loop():
+                asyncio.run(self._run_cycles_async())
+            else:
+                while True:
+                    goal = self._get_next_goal()
+                    if not goal:
+                        break
+                    self._process_goal(goal)
+        finally:
+            # Snapshots and learning entries are write-buffered; persist them
+            # even if a role raised
+            self.snapshot_store.flush()
+            self.learning_log.flush()
+
+    async def _run_cycles_async(self) -> None:
+        """Works on up to max_concurrent_goals pending goals at a time.
+
+        Each goal gets its own Context and role instances and runs in a worker
+        thread. All goals still share code_dir, so every configured role class
+        must opt in with ``concurrent_goals_safe = True``.
+
+        Raises:
+            ValueError: If a configured role class has not opted in
+        """
+        limit = self.config.engine.max_concurrent_goals
+        unsafe = [
+            role_conf.class_name
+            for role_conf in self.config.roles
+            if not getattr(
+                _resolve_class(role_conf.module, role_conf.class_name),
+                "concurrent_goals_safe",
+                False,
+            )
+        ]
+        if unsafe:
+            raise ValueError(
+                f"engine.max_concurrent_goals > 1 needs roles with "
+                f"concurrent_goals_safe = True; not set on: {unsafe}"
+            )
+        self._configure_role_graph()  # once, before threads start
         while True:
-            goal = self._get_next_goal()
-            if not goal:
-                break
+            goals = self.goal_manager.next_goals(limit)
+            if not goals:
+                goal = self._get_next_goal()  # falls back to goal generation
+                if not goal:
+                    break
+                goals = [goal, *self.goal_manager.next_goals(limit - 1)]
+            await asyncio.gather(
+                *(
+                    asyncio.to_thread(
+                        self._process_goal,
+                        goal,
+                        tuple(self._load_roles(self.config.roles)),
+                    )
+                    for goal in goals
+                )
+            )
+
+    def _process_goal(self, goal: Goal, roles: Optional[Tuple[Role, ...]] = None) -> None:
+        """Sets up the context for goal and runs its attempts.
+
+        Args:
+            goal: The goal to work on
+            roles: Role instances private to this goal; defaults to self.roles
+        """
+        context = self._setup_goal_context(goal)
+        self._execute_goal_attempts(context, roles)
 
-            context = self._setup_goal_context(goal)
-            self._execute_goal_attempts(context)
+    def warmup(self) -> None:
+        """Imports GoalGenerationRole ahead of the first autonomous goal generation.
+
+        Called when run_cycles starts; configured roles and plugins are already
+        loaded by __init__. A failure is logged here and raised again when
+        goal generation first needs the class.
+        """
+        module_path, class_name = "ai_self_ext_engine.roles.goal_generation", "GoalGenerationRole"
+        try:
+            _resolve_class(module_path, class_name)
+        except (ImportError, AttributeError) as e:
+            self.logger.warning(
+                "Could not pre-load '%s.%s': %s", module_path, class_name, e
+            )
 
     def _get_next_goal(self) -> Goal | None:
         """Get the next goal to process, with autonomous generation fallback.
@@ -150,13 +290,14 @@ class Engine:
         Returns:
             Context: Configured context object ready for goal processing
         """
-        context = Context(code_dir=self.config.engine.code_dir, goal=goal)
-        goal = cast(Goal, context.goal)  # Ensure goal is correctly typed
+        context = Context(code_dir=self._code_dir_str, goal=goal)
 
+        goal_extra = {"goal_id": goal.goal_id}
         self.logger.info(
-            "\n--- Processing Goal: %s - %s ---",
+            "--- Processing Goal: %s - %s ---",
             goal.goal_id,
             goal.description,
+            extra=goal_extra,
         )
 
         loaded_snapshot = self.snapshot_store.load_latest(goal.goal_id)
@@ -166,71 +307,154 @@ class Engine:
             self.logger.info(
                 "Resuming goal '%s' from previous snapshot.",
                 goal.goal_id,
+                extra=goal_extra,
             )
         else:
             self.logger.info(
                 "Starting new attempt for goal '%s'.",
                 goal.goal_id,
+                extra=goal_extra,
             )
             context.todos = []
 
         return context
 
-    def _execute_goal_attempts(self, context: Context) -> None:
+    def _execute_goal_attempts(
+        self, context: Context, roles: Optional[Tuple[Role, ...]] = None
+    ) -> None:
         """Execute multiple attempts for a goal until completion or max cycles reached."""
-        for attempt in range(self.config.engine.max_cycles):
-            goal = cast(Goal, context.goal)  # Ensure goal is not None
-            self.logger.info(
-                "\n--- Goal '%s' Attempt %s/%s ---",
-                goal.goal_id,
-                attempt + 1,
-                self.config.engine.max_cycles,
-            )
-
-            self._reset_attempt_state(context)
-            result = self._execute_roles(context)
-            self._record_attempt_results(context, goal)
-
-            if result == "completed":
-                self.goal_manager.mark_done(goal.goal_id)
+        goal: Goal = context.goal  # set by _setup_goal_context; fixed across attempts
+        goal_id = goal.goal_id
+        max_cycles = self._max_cycles
+        goal_extra = {"goal_id": goal_id}  # structured field for JSON logs
+        log_info = self.logger.isEnabledFor(logging.INFO)
+        # Bound once here rather than looked up on every attempt
+        reset = context.reset_attempt
+        execute = self._execute_roles
+        record = self._record_attempt_results
+        for attempt in range(max_cycles):
+            if log_info:
                 self.logger.info(
-                    "Goal '%s' completed in %s attempts.",
-                    goal.goal_id,
+                    "--- Goal '%s' Attempt %s/%s ---",
+                    goal_id,
                     attempt + 1,
+                    max_cycles,
+                    extra=goal_extra,
                 )
+
+            reset()
+            result = execute(context, roles)
+            record(context, goal)
+
+            if result == "completed":
+                with self._record_lock:
+                    self.goal_manager.mark_done(goal_id)
+                if log_info:
+                    self.logger.info(
+                        "Goal '%s' completed in %s attempts.",
+                        goal_id,
+                        attempt + 1,
+                        extra=goal_extra,
+                    )
                 break
             elif result == "aborted":
                 self.logger.warning(
                     "Goal '%s' aborted after %s attempts.",
-                    goal.goal_id,
+                    goal_id,
                     attempt + 1,
+                    extra=goal_extra,
                 )
                 break  # Move to the next pending goal
 
-    def _reset_attempt_state(self, context: Context) -> None:
-        """Reset transient state for a new attempt."""
-        context.patch = None
-        context.test_results = None
-        context.review = None
-        context.accepted = False
-        context.should_abort = False
+    def _bind_roles(self) -> _RoleDispatch:
+        """Builds the (role name, bound run) dispatch list, and the role graph if configured."""
+        dispatch = self._role_dispatch
+        if dispatch is None:
+            dispatch = self._role_dispatch = self._dispatch_for(self.roles)
+            self._configure_role_graph()
+        return dispatch
+
+    def _configure_role_graph(self) -> None:
+        """Builds the role graph when roles may run concurrently."""
+        if self.config.engine.max_concurrent_roles > 1 and any(
+            rc.depends_on is not None for rc in self.config.roles
+        ):
+            self._role_graph = self._build_role_graph(
+                [rc.class_name for rc in self.config.roles]
+            )
+
+    @staticmethod
+    def _dispatch_for(roles: Tuple[Role, ...]) -> _RoleDispatch:
+        return tuple(
+            (role.__class__.__name__, role.run)
+            for role in roles
+        )
 
-    def _execute_roles(self, context: Context) -> str:
+    def _build_role_graph(self, role_names: List[str]) -> List[FrozenSet[int]]:
+        """Maps each role index to the indices it waits for.
+
+        A role without depends_on waits for the role listed before it, so the
+        configured order holds unless a role opts out explicitly.
+
+        Raises:
+            ValueError: If depends_on names an unknown role or the roles form a cycle
+        """
+        first_index: Dict[str, int] = {}
+        for i, name in enumerate(role_names):
+            first_index.setdefault(name, i)
+        graph: List[FrozenSet[int]] = []
+        for i, role_conf in enumerate(self.config.roles):
+            if role_conf.depends_on is None:
+                graph.append(frozenset({i - 1}) if i else frozenset())
+                continue
+            unknown = [dep for dep in role_conf.depends_on if dep not in first_index]
+            if unknown:
+                raise ValueError(f"Role '{role_names[i]}' depends on unknown role(s): {unknown}")
+            graph.append(frozenset(first_index[dep] for dep in role_conf.depends_on))
+
+        # Reject cycles up front rather than deadlocking mid-attempt
+        done: Set[int] = set()
+        while len(done) < len(graph):
+            ready = [i for i, deps in enumerate(graph) if i not in done and deps <= done]
+            if not ready:
+                raise ValueError("Role depends_on settings form a cycle")
+            done.update(ready)
+        return graph
+
+    def _execute_roles(
+        self, context: Context, roles: Optional[Tuple[Role, ...]] = None
+    ) -> str:
         """Execute all roles and return the result status.
 
+        Roles run in order unless engine.max_concurrent_roles > 1 and some role
+        sets depends_on, in which case independent roles overlap (see
+        _execute_roles_async). Inside a running event loop they always run in
+        order, since asyncio.run() can't nest.
+
         Args:
             context: The execution context containing goal and state information
+            roles: Role instances to run instead of self.roles
 
         Returns:
             str: Status string - "completed", "aborted", or "continue"
         """
-        for role in self.roles:
-            self.logger.info("Executing role: %s", role.__class__.__name__)
-            context = role.run(context)
+        if roles is None:
+            roles = self.roles
+            dispatch = self._bind_roles()
+        else:
+            dispatch = self._dispatch_for(roles)
+        if self._role_graph is not None and not _in_event_loop():
+            return asyncio.run(self._execute_roles_async(context, roles, dispatch))
+
+        log_info = self.logger.isEnabledFor(logging.INFO)
+        for role_name, run in dispatch:
+            if log_info:
+                self.logger.info("Executing role: %s", role_name)
+            context = run(context)
             if context.should_abort:
                 self.logger.warning(
                     "Role %s requested abort. Stopping attempt.",
-                    role.__class__.__name__,
+                    role_name,
                 )
                 return "aborted"
 
@@ -238,11 +462,66 @@ class Engine:
             return "completed"
         return "continue"
 
+    async def _execute_roles_async(
+        self, context: Context, roles: Tuple[Role, ...], dispatch: _RoleDispatch
+    ) -> str:
+        """Runs roles as their dependencies finish, at most max_concurrent_roles at a time.
+
+        Roles share and mutate the one Context in place. Each runs in a worker
+        thread unless it provides its own ``run_async``. Context has no locking,
+        so roles left free to overlap must not write the same fields; depends_on
+        is how a config serializes roles that do.
+        """
+        graph = cast(List[FrozenSet[int]], self._role_graph)
+        semaphore = asyncio.Semaphore(self.config.engine.max_concurrent_roles)
+
+        async def run_role(index: int) -> None:
+            role_name, run = dispatch[index]
+            async with semaphore:
+                self.logger.info("Executing role: %s", role_name)
+                run_async = getattr(roles[index], "run_async", None)
+                if run_async is not None:
+                    await run_async(context)
+                else:
+                    await asyncio.to_thread(run, context)
+
+        pending = set(range(len(dispatch)))
+        done: Set[int] = set()
+        running: Dict[asyncio.Task, int] = {}
+        aborted_by: Optional[str] = None
+        while pending or running:
+            if aborted_by is None:
+                for index in [i for i in pending if graph[i] <= done]:
+                    pending.discard(index)
+                    running[asyncio.create_task(run_role(index))] = index
+            if not running:
+                break
+            finished, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+            for task in finished:
+                index = running.pop(task)
+                if task.exception() is not None:
+                    # Let in-flight roles finish before propagating, as they
+                    # still hold the shared context
+                    await asyncio.gather(*running, return_exceptions=True)
+                    raise cast(BaseException, task.exception())
+                done.add(index)
+                if aborted_by is None and context.should_abort:
+                    aborted_by = dispatch[index][0]
+            if aborted_by is not None:
+                pending.clear()  # start nothing new; drain what is running
+
+        if aborted_by is not None:
+            self.logger.warning(
+                "Role %s requested abort. Stopping attempt.",
+                aborted_by,
+            )
+            return "aborted"
+        if context.accepted:
+            return "completed"
+        return "continue"
+
     def _record_attempt_results(self, context: Context, goal: Goal) -> None:
         """Record snapshot and learning entry for the attempt."""
-        self.snapshot_store.record(context)
-
-        # Record learning entry
         learning_entry = create_learning_entry(
             goal=goal.description,
             patch=context.patch or "",
@@ -250,6 +529,7 @@ class Engine:
             review=context.review or "",
             success=context.accepted,
         )
+        self.snapshot_store.record(context)
         self.learning_log.record_entry(learning_entry)
 
     def _attempt_autonomous_goal_generation(self) -> bool:
@@ -263,21 +543,22 @@ class Engine:
             context = self._run_goal_generation(goal_generator)
             return self._process_generated_goals(context)
         except ImportError as e:
-            self.logger.error(f"GoalGenerationRole not available: {e}")
+            self.logger.error("GoalGenerationRole not available: %s", e)
             return False
         except Exception as e:
-            self.logger.error(f"Autonomous goal generation failed: {e}")
+            self.logger.error("Autonomous goal generation failed: %s", e)
             return False
 
     def _create_goal_generator(self):
         """Create and return a GoalGenerationRole instance."""
-        from ai_self_ext_engine.roles.goal_generation import GoalGenerationRole
-
-        return GoalGenerationRole(self.config, self.model_client)
+        goal_generation_role = _resolve_class(
+            "ai_self_ext_engine.roles.goal_generation", "GoalGenerationRole"
+        )
+        return goal_generation_role(self.config, self.model_client)
 
     def _run_goal_generation(self, goal_generator) -> Context:
         """Run goal generation and return the updated context."""
-        context = Context(code_dir=self.config.engine.code_dir)
+        context = Context(code_dir=self._code_dir_str)
         return goal_generator.run(context)
 
     def _process_generated_goals(self, context: Context) -> bool:
@@ -287,29 +568,31 @@ class Engine:
             return False
 
         generated_goals = context.metadata["generated_goals"]
-        self.logger.info(f"Generated {len(generated_goals)} autonomous goals")
-
-        goals_added = 0
-        for goal_data in generated_goals:
-            if self._add_single_goal(goal_data):
-                goals_added += 1
-
-        return goals_added > 0
-
-    def _add_single_goal(self, goal_data: dict) -> bool:
-        """Add a single goal to the goal manager."""
+        self.logger.info("Generated %d autonomous goals", len(generated_goals))
+
+        goals = [
+            goal
+            for goal in (self._build_generated_goal(goal_data) for goal_data in generated_goals)
+            if goal is not None
+        ]
+        if not goals:
+            return False
+        # One save for the whole batch instead of one per goal
+        self.goal_manager.add_goals(goals)
+        if self.logger.isEnabledFor(logging.INFO):
+            for goal in goals:
+                self.logger.info("Added autonomous goal: %s", goal.description)
+        return True
+
+    def _build_generated_goal(self, goal_data: dict) -> Optional[Goal]:
+        """Build a Goal from generated goal data, or None if the data is malformed."""
         try:
-            from ai_self_ext_engine.goal_manager import Goal
-
-            goal = Goal(
+            return Goal(
                 goal_id=goal_data["id"],
                 description=goal_data["description"],
                 priority=goal_data.get("priority", "medium"),
                 metadata=goal_data.get("metadata", {}),
             )
-            self.goal_manager.add_goal(goal)
-            self.logger.info(f"Added autonomous goal: {goal.description}")
-            return True
         except Exception as e:
-            self.logger.error(f"Failed to add generated goal: {e}")
-            return False
+            self.logger.error("Failed to add generated goal: %s", e)
+            return None
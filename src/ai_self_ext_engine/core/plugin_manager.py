@@ -1,7 +1,10 @@
+import importlib
 import importlib.util
 import logging
+import os
 from pathlib import Path
-from typing import Dict, Type, Any, List, Optional
+from types import ModuleType
+from typing import Dict, Type, Any, List, Optional, Set, Tuple
 
 logger = logging.getLogger(__name__)
 
@@ -13,6 +16,8 @@ class BasePlugin:
     """
     name: str = "UnnamedPlugin"
     description: str = "A generic plugin."
+    # A dictionary to expose specific capabilities (e.g., tools, data handlers)
+    capabilities: Dict[str, Any] = {}
 
     def __init__(self, **kwargs):
         """
@@ -47,6 +52,14 @@ class PluginManager:
     """
     def __init__(self):
         self._plugins: Dict[str, BasePlugin] = {}
+        # Classes already found to provide name and a callable execute();
+        # checked once per class
+        self._validated_plugin_types: Set[type] = set()
+        # Plugin modules already executed, keyed by file path with the mtime
+        # they were loaded at; rescans reuse them until the file changes
+        self._module_cache: Dict[str, Tuple[int, ModuleType]] = {}
+        # Store capabilities exposed by registered plugins
+        self._all_plugin_capabilities: Dict[str, Dict[str, Any]] = {}
         logger.debug("PluginManager initialized.")
 
     def register_plugin(self, plugin_instance: BasePlugin):
@@ -54,16 +67,53 @@ class PluginManager:
         Registers a plugin instance with the manager.
 
         Args:
-            plugin_instance: An instance of a class inheriting from BasePlugin.
-        """
-        if not isinstance(plugin_instance, BasePlugin):
-            raise TypeError(f"Provided object is not an instance of BasePlugin: {type(plugin_instance)}")
+            plugin_instance: An instance of a class inheriting from BasePlugin,
+                or any object whose class provides `name` and a callable `execute`.
+        """
+        plugin_type = type(plugin_instance)
+        if plugin_type not in self._validated_plugin_types:
+            missing = []
+            if not hasattr(plugin_instance, "name"):
+                missing.append("name")
+            if not callable(getattr(plugin_type, "execute", None)):
+                missing.append("callable execute")
+            if missing:
+                raise TypeError(
+                    f"Provided object is not an instance of BasePlugin and lacks "
+                    f"{' and '.join(missing)}: {plugin_type}"
+                )
+            self._validated_plugin_types.add(plugin_type)
 
         if plugin_instance.name in self._plugins:
             logger.warning(f"Plugin '{plugin_instance.name}' already registered. Overwriting existing plugin.")
 
         self._plugins[plugin_instance.name] = plugin_instance
-        logger.info(f"Plugin '{plugin_instance.name}' registered.")
+        # Store the plugin's capabilities
+        capabilities = getattr(plugin_instance, "capabilities", None)
+        if capabilities:
+            self._all_plugin_capabilities[plugin_instance.name] = capabilities
+            logger.info(f"Plugin '{plugin_instance.name}' registered with capabilities: {list(capabilities.keys())}")
+        else:
+            self._all_plugin_capabilities.pop(plugin_instance.name, None)
+            logger.info(f"Plugin '{plugin_instance.name}' registered.")
+
+    def unregister_plugin(self, name: str) -> bool:
+        """
+        Removes a registered plugin by its name.
+
+        Args:
+            name: The name of the plugin to remove.
+
+        Returns:
+            True if the plugin was registered and has been removed, otherwise False.
+        """
+        if name not in self._plugins:
+            logger.warning(f"Attempted to unregister non-existent plugin: '{name}'.")
+            return False
+        del self._plugins[name]
+        self._all_plugin_capabilities.pop(name, None)
+        logger.info(f"Plugin '{name}' unregistered.")
+        return True
 
     def get_plugin(self, name: str) -> Optional[BasePlugin]:
         """
@@ -83,45 +133,80 @@ class PluginManager:
         """
         return self._plugins.copy()
 
-    def load_plugins_from_directory(self, plugin_dir: Path, plugin_base_class: Type[BasePlugin] = BasePlugin):
+    @property
+    def registered_plugin_names(self) -> List[str]:
         """
-        Scans a directory for Python files, attempts to import them as modules,
-        and registers classes inheriting from `plugin_base_class` as plugins.
+        Names of all registered plugins, in registration order.
         """
-        if not plugin_dir.is_dir():
-            logger.warning(f"Plugin directory not found or is not a directory: {plugin_dir}")
-            return
-
-        logger.info(f"Loading plugins from directory: {plugin_dir}")
-        for filepath in plugin_dir.glob("*.py"):
-            if filepath.name == "__init__.py":
+        return list(self._plugins)
 
-# AI-generated improvements:
-    # A dictionary to expose specific capabilities (e.g., tools, data handlers)
-    capabilities: Dict[str, Any] = {}
-        # Store capabilities exposed by registered plugins
-        self._all_plugin_capabilities: Dict[str, Dict[str, Any]] = {}
-        # Store the plugin's capabilities
-        if plugin_instance.capabilities:
-            self._all_plugin_capabilities[plugin_instance.name] = plugin_instance.capabilities
-            logger.info(f"Plugin '{plugin_instance.name}' registered with capabilities: {list(plugin_instance.capabilities.keys())}")
-        else:
-            logger.info(f"Plugin '{plugin_instance.name}' registered.")
     def get_plugin_capabilities(self, plugin_name: str) -> Optional[Dict[str, Any]]:
         """
         Retrieves the capabilities exposed by a specific registered plugin.
+
         Args:
             plugin_name: The name of the plugin.
+
         Returns:
             A dictionary of capabilities if the plugin is found and exposes any, otherwise None.
         """
         return self._all_plugin_capabilities.get(plugin_name)
+
     def get_all_plugin_capabilities(self) -> Dict[str, Dict[str, Any]]:
         """
         Retrieves a copy of all capabilities registered by all plugins,
         keyed by plugin name.
-        Returns:
-            A dictionary where keys are plugin names and values are their
-            respective capabilities dictionaries.
         """
-        return self._all_plugin_capabilities.copy()
\ No newline at end of file
+        return self._all_plugin_capabilities.copy()
+
+    def load_plugins_from_directory(self, plugin_dir: Path, plugin_base_class: Type[BasePlugin] = BasePlugin):
+        """
+        Scans a directory for Python files, attempts to import them as modules,
+        and registers classes inheriting from `plugin_base_class` as plugins.
+        """
+        if not plugin_dir.is_dir():
+            logger.warning(f"Plugin directory not found or is not a directory: {plugin_dir}")
+            return
+
+        logger.info(f"Loading plugins from directory: {plugin_dir}")
+        with os.scandir(plugin_dir) as entries:
+            for entry in entries:
+                if not entry.name.endswith(".py") or entry.name == "__init__.py" or not entry.is_file():
+                    continue
+                module = self._load_plugin_module(entry)
+                if module is None:
+                    continue
+                for obj in list(vars(module).values()):
+                    if (
+                        isinstance(obj, type)
+                        and issubclass(obj, plugin_base_class)
+                        and obj is not plugin_base_class
+                        and obj.__module__ == module.__name__
+                    ):
+                        try:
+                            self.register_plugin(obj())
+                        except Exception as e:
+                            logger.error(f"Failed to instantiate plugin '{obj.__name__}' from '{entry.name}': {e}")
+
+    def _load_plugin_module(self, entry: os.DirEntry) -> Optional[ModuleType]:
+        """
+        Imports a plugin file, or returns the module from an earlier scan if the
+        file has not been modified since.
+        """
+        mtime_ns = entry.stat().st_mtime_ns
+        cached = self._module_cache.get(entry.path)
+        if cached is not None:
+            if cached[0] == mtime_ns:
+                return cached[1]
+            # The file changed; drop stale finder caches before re-importing
+            importlib.invalidate_caches()
+
+        try:
+            spec = importlib.util.spec_from_file_location(entry.name[:-3], entry.path)
+            module = importlib.util.module_from_spec(spec)
+            spec.loader.exec_module(module)
+        except Exception as e:
+            logger.error(f"Failed to load module '{entry.name}' as a plugin: {e}")
+            return None
+        self._module_cache[entry.path] = (mtime_ns, module)
+        return module
@@ -1,15 +1,53 @@
+import logging
+import time
 from abc import abstractmethod
-from dataclasses import dataclass, field
+from collections import deque
+from dataclasses import dataclass, field, fields
 from datetime import datetime
 from enum import Enum
-from typing import (TYPE_CHECKING, Any, Dict, List, Optional, Protocol,
-                    TypeVar, Union)
+from functools import lru_cache
+from heapq import merge
+from operator import itemgetter
+from typing import (TYPE_CHECKING, Any, Deque, Dict, List, Optional,
+                    Protocol, Tuple, Type, TypeVar, Union)
 
 if TYPE_CHECKING:
     from ai_self_ext_engine.goal_manager import Goal
     from ai_self_ext_engine.todo_schema import Todo  # Import for type hinting
 
 
+@lru_cache(maxsize=1)
+def _iso_for_tick(tick: int) -> str:
+    # Fixed width: a bare isoformat() drops the fraction on whole seconds
+    return datetime.fromtimestamp(tick / 10).isoformat(timespec="milliseconds")
+
+
+def _iso_now() -> str:
+    """Local time in ISO format at 100 ms resolution, formatted once per tick"""
+    return _iso_for_tick(int(time.time() * 10))
+
+
+_T = TypeVar("_T")
+
+
+def _slotted(cls: Type[_T]) -> Type[_T]:
+    """
+    Recreates a dataclass with __slots__ for its fields, as dataclass(slots=True)
+    does on Python 3.10+. Apply it outside @dataclass. The class attributes
+    holding field defaults have to go, since they would shadow the slots; the
+    generated __init__ keeps its own copy of the defaults.
+    """
+    field_names = tuple(f.name for f in fields(cls))
+    cls_dict = {
+        key: value for key, value in cls.__dict__.items()
+        if key not in field_names and key not in ("__dict__", "__weakref__")
+    }
+    cls_dict["__slots__"] = field_names
+    slotted = type(cls)(cls.__name__, cls.__bases__, cls_dict)
+    slotted.__qualname__ = cls.__qualname__
+    return slotted
+
+
 class FeedbackType(Enum):
     """Types of feedback that roles can provide to each other"""
     SUCCESS = "success"
@@ -20,6 +58,7 @@ class FeedbackType(Enum):
     DEPENDENCY = "dependency"
 
 
+@_slotted
 @dataclass
 class RoleFeedback:
     """Structured feedback between roles"""
@@ -32,6 +71,7 @@ class RoleFeedback:
     priority: str = "medium"  # high, medium, low
 
 
+@_slotted
 @dataclass
 class RoleMetrics:
     """Performance and effectiveness metrics for roles"""
@@ -43,12 +83,14 @@ class RoleMetrics:
     improvement_suggestions: List[str] = field(default_factory=list)
 
 
+@_slotted
 @dataclass
 class Context:
     """
     The central data object passed between roles, containing all relevant
     information for the current improvement cycle.
     Enhanced with advanced feedback loops and role communication.
+    Slotted: roles may only set the fields declared below.
     """
     code_dir: str
     current_code: Optional[str] = None
@@ -67,21 +109,48 @@ class Context:
     role_metrics: Dict[str, RoleMetrics] = field(default_factory=dict)
     execution_history: List[Dict[str, Any]] = field(default_factory=list)
     learning_insights: List[str] = field(default_factory=list)
+    # feedback_queue entries by to_role, as (queue position, feedback) pairs;
+    # built in __post_init__ and maintained by add_feedback
+    _feedback_by_role: Dict[Optional[str], List[Tuple[int, RoleFeedback]]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        # Index feedback passed in, e.g. Context(feedback_queue=...) or
+        # dataclasses.replace()
+        for position, feedback in enumerate(self.feedback_queue):
+            self._feedback_by_role.setdefault(feedback.to_role, []).append(
+                (position, feedback)
+            )
     
+    def reset_attempt(self) -> None:
+        """Clear the per-attempt state before the roles run again"""
+        self.patch = None
+        self.test_results = None
+        self.review = None
+        self.accepted = False
+        self.should_abort = False
+
     def add_feedback(self, feedback: RoleFeedback):
         """Add feedback from one role to another"""
+        self._feedback_by_role.setdefault(feedback.to_role, []).append(
+            (len(self.feedback_queue), feedback)
+        )
         self.feedback_queue.append(feedback)
     
     def get_feedback_for_role(self, role_name: str) -> List[RoleFeedback]:
-        """Get all feedback intended for a specific role"""
-        return [fb for fb in self.feedback_queue 
-                if fb.to_role is None or fb.to_role == role_name]
+        """Get all feedback intended for a specific role, in the order it was added"""
+        if not self.feedback_queue:
+            return []
+        broadcast = self._feedback_by_role.get(None, ())
+        targeted = self._feedback_by_role.get(role_name, ())
+        return [fb for _, fb in merge(broadcast, targeted, key=itemgetter(0))]
     
     def record_role_execution(self, role_name: str, execution_data: Dict[str, Any]):
         """Record execution details for a role"""
         execution_record = {
             "role": role_name,
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": _iso_now(),
             "data": execution_data
         }
         self.execution_history.append(execution_record)
@@ -96,7 +165,7 @@ class Context:
     
     def add_learning_insight(self, insight: str):
         """Add a learning insight from the current cycle"""
-        self.learning_insights.append(f"[{datetime.now().isoformat()}] {insight}")
+        self.learning_insights.append(f"[{_iso_now()}] {insight}")
 
 
 class Role(Protocol):  # Change to Protocol
@@ -121,11 +190,18 @@ class AdaptiveRole:
     Base class for roles with advanced feedback and adaptation capabilities.
     Provides common functionality for inter-role communication and learning.
     """
+
+    # Subclasses set this when a run finds issues downstream roles should hear about
+    _found_issues: bool = False
     
     def __init__(self, name: str, model_client=None):
         self.name = name
         self.model_client = model_client
-        self.performance_history = []
+        # Last 50 executions; the last 10 also feed running sums for the averages
+        self.performance_history: Deque[Dict[str, Any]] = deque(maxlen=50)
+        self._recent_executions: Deque[Dict[str, Any]] = deque(maxlen=10)
+        self._recent_duration_sum = 0.0
+        self._recent_success_count = 0
         self.adaptation_settings = {}
         self.logger = logging.getLogger(f"{__name__}.{name}")
     
@@ -134,14 +210,21 @@ class AdaptiveRole:
         Template method that handles feedback processing and performance tracking.
         Subclasses should implement execute_role_logic.
         """
-        start_time = time.time()
+        name = self.name
+        # start_time/end_time are epoch seconds; duration comes from the
+        # monotonic clock so it survives wall-clock jumps
+        wall, mono = time.time, time.monotonic
+        start_time = wall()
+        started = mono()
+        # Taken up front: roles usually mutate and return the same context
+        insights_before = len(context.learning_insights)
         
         # Process incoming feedback before execution
         relevant_feedback = self._process_incoming_feedback(context)
         
         # Record execution start
         execution_record = {
-            "role": self.name,
+            "role": name,
             "start_time": start_time,
             "feedback_received": len(relevant_feedback),
             "goal_id": getattr(context.goal, 'goal_id', None) if context.goal else None
@@ -152,12 +235,12 @@ class AdaptiveRole:
             updated_context = self.execute_role_logic(context, relevant_feedback)
             
             # Record successful execution
-            end_time = time.time()
+            duration = mono() - started
             execution_record.update({
-                "end_time": end_time,
-                "duration": end_time - start_time,
+                "end_time": wall(),
+                "duration": duration,
                 "status": "success",
-                "insights_generated": len(updated_context.learning_insights) - len(context.learning_insights)
+                "insights_generated": len(updated_context.learning_insights) - insights_before
             })
             
             # Update role metrics
@@ -167,23 +250,24 @@ class AdaptiveRole:
             self._generate_feedback_for_peers(updated_context)
             
             # Record execution in context
-            updated_context.record_role_execution(self.name, execution_record)
+            updated_context.record_role_execution(name, execution_record)
             
             return updated_context
             
         except Exception as e:
             # Record failed execution
+            duration = mono() - started
             execution_record.update({
-                "end_time": time.time(),
-                "duration": time.time() - start_time,
+                "end_time": wall(),
+                "duration": duration,
                 "status": "error",
                 "error": str(e)
             })
             
             self._update_performance_metrics(execution_record, False)
-            context.record_role_execution(self.name, execution_record)
+            context.record_role_execution(name, execution_record)
             
-            self.logger.error(f"Role {self.name} failed: {e}")
+            self.logger.error("Role %s failed: %s", name, e)
             raise
     
     @abstractmethod
@@ -202,10 +286,13 @@ class AdaptiveRole:
     
     def _process_incoming_feedback(self, context: Context) -> List[RoleFeedback]:
         """Process and filter feedback relevant to this role"""
+        if not context.feedback_queue:
+            return []
         relevant_feedback = context.get_feedback_for_role(self.name)
         
         if relevant_feedback:
-            self.logger.info(f"Processing {len(relevant_feedback)} feedback items for {self.name}")
+            if self.logger.isEnabledFor(logging.INFO):
+                self.logger.info("Processing %d feedback items for %s", len(relevant_feedback), self.name)
             
             # Adapt behavior based on feedback
             self._adapt_based_on_feedback(relevant_feedback)
@@ -239,7 +326,7 @@ class AdaptiveRole:
     def _generate_feedback_for_peers(self, context: Context):
         """Generate feedback for other roles based on execution results"""
         # Example: If this role found issues, warn downstream roles
-        if hasattr(self, "_found_issues") and self._found_issues:
+        if self._found_issues:
             feedback = RoleFeedback(
                 from_role=self.name,
                 to_role="TestRole",  # Example: warn test role
@@ -256,14 +343,17 @@ class AdaptiveRole:
         """Update performance tracking"""
         self.performance_history.append(execution_record)
         
-        # Keep only recent history (last 50 executions)
-        if len(self.performance_history) > 50:
-            self.performance_history = self.performance_history[-50:]
-        
-        # Calculate rolling averages
-        recent_executions = self.performance_history[-10:]
-        avg_duration = sum(ex.get("duration", 0) for ex in recent_executions) / len(recent_executions)
-        success_rate = sum(1 for ex in recent_executions if ex.get("status") == "success") / len(recent_executions)
+        # Calculate rolling averages, retiring the record that falls out of the window
+        recent_executions = self._recent_executions
+        if len(recent_executions) == recent_executions.maxlen:
+            oldest = recent_executions[0]
+            self._recent_duration_sum -= oldest.get("duration", 0)
+            self._recent_success_count -= oldest.get("status") == "success"
+        recent_executions.append(execution_record)
+        self._recent_duration_sum += execution_record.get("duration", 0)
+        self._recent_success_count += execution_record.get("status") == "success"
+        avg_duration = self._recent_duration_sum / len(recent_executions)
+        success_rate = self._recent_success_count / len(recent_executions)
         
         # Update context metrics if available
         metrics = RoleMetrics(
@@ -1,10 +1,18 @@
 import json
+import os
 from pathlib import Path
 import logging # Import logging
 from typing import Any, Dict, List, Optional
 
+try:
+    import orjson
+except ImportError:  # stdlib fallback keeps minimal environments working
+    orjson = None
+
 class Goal:
     """Represents a single improvement goal."""
+    __slots__ = ("goal_id", "description", "status", "priority", "metadata")
+
     def __init__(self, goal_id: str, description: str, status: str = "pending", 
                  priority: str = "medium", metadata: Optional[Dict[str, Any]] = None):
         self.goal_id = goal_id
@@ -22,6 +30,9 @@ class Goal:
             "metadata": self.metadata
         }
 
+# Keys of a goal entry in the goals file, as written by Goal.to_dict
+_GOAL_KEYS = frozenset(("id", "description", "status", "priority", "metadata"))
+
 class GoalManager:
     """Manages the loading, serving, and tracking of improvement goals."""
     def __init__(self, goals_path: str):
@@ -30,42 +41,98 @@ class GoalManager:
         self.goals_path = Path(goals_path)
         self.logger = logging.getLogger(__name__) # New logger
         self.goals: List[Goal] = []
+        self._goals_by_id: Dict[str, Goal] = {}
+        # Append-only log of completed goal ids, so mark_done doesn't rewrite the
+        # whole goals file; folded back into it by the next save_goals()
+        self._done_log_path = self.goals_path.with_name(self.goals_path.name + ".done.jsonl")
         self._load_goals()
         self._current_goal_index = 0
 
     def _load_goals(self):
         """Loads goals from the specified JSON file."""
         if not self.goals_path.exists():
-            self.logger.info(f"Goals file not found at {self.goals_path}. Starting with no goals.")
+            self.logger.info("Goals file not found at %s. Starting with no goals.", self.goals_path)
             return
 
         try:
-            with open(self.goals_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                # If data is a list, assume it's directly the list of goal items
-                if isinstance(data, list):
-                    goal_items = data
-                else: # Otherwise, assume it's a dict with a "goals" key
-                    goal_items = data.get("goals", [])
-
-                for item in goal_items:
-                    # Map 'id' from JSON to 'goal_id' for Goal constructor
-                    item['goal_id'] = item.pop('id') 
-                    self.goals.append(Goal(**item))
+            with open(self.goals_path, 'rb') as f:
+                raw = f.read()
+            # orjson.JSONDecodeError subclasses json.JSONDecodeError
+            data = orjson.loads(raw) if orjson is not None else json.loads(raw)
+            # If data is a list, assume it's directly the list of goal items
+            if isinstance(data, list):
+                goal_items = data
+            else: # Otherwise, assume it's a dict with a "goals" key
+                goal_items = data.get("goals", [])
+
+            append = self._append
+            for item in goal_items:
+                # 'id' in the file is goal_id on Goal
+                get = item.get
+                if len(item) > 2 and not _GOAL_KEYS.issuperset(item):
+                    self.logger.warning("Goal '%s' has unknown keys %s; they are not loaded and will be dropped on save.",
+                                        get('id'), sorted(item.keys() - _GOAL_KEYS))
+                append(Goal(item['id'], item['description'], get('status', "pending"),
+                            get('priority', "medium"), get('metadata')))
+            self._apply_done_log()
         except json.JSONDecodeError:
-            self.logger.error(f"Error decoding goals JSON from {self.goals_path}. File might be corrupted.")
+            self.logger.error("Error decoding goals JSON from %s. File might be corrupted.", self.goals_path)
         except Exception as e:
-            self.logger.error(f"Error loading goals from {self.goals_path}: {e}")
+            self.logger.error("Error loading goals from %s: %s", self.goals_path, e)
+
+    def _append(self, goal: Goal):
+        self.goals.append(goal)
+        self._goals_by_id.setdefault(goal.goal_id, goal)
+
+    def _apply_done_log(self):
+        """Replays completions recorded by mark_done since the last full save."""
+        try:
+            if os.stat(self._done_log_path).st_mtime_ns < os.stat(self.goals_path).st_mtime_ns:
+                # The goals file was edited after the last logged completion;
+                # its statuses win over the stale log
+                self.logger.info("Ignoring %s: %s was modified after it.", self._done_log_path, self.goals_path)
+                self._done_log_path.unlink(missing_ok=True)
+                return
+            with open(self._done_log_path, 'rb') as f:
+                lines = f.read().splitlines()
+        except FileNotFoundError:
+            return
+        damaged = False
+        for line in lines:
+            if not line.strip():
+                continue
+            try:
+                goal_id = json.loads(line)["id"]
+            except (ValueError, KeyError, TypeError):
+                # e.g. the tail of an append cut short by a crash
+                self.logger.warning("Skipping unreadable line in %s: %r", self._done_log_path, line)
+                damaged = True
+                continue
+            goal = self._goals_by_id.get(goal_id)
+            if goal is not None:
+                goal.status = "completed"
+        if damaged:
+            # Fold the readable completions into the goals file, dropping the log
+            self.save_goals()
 
     def save_goals(self):
         """Saves the current state of goals back to the JSON file."""
         # Always save as a dictionary with a "goals" key
         data = {"goals": [goal.to_dict() for goal in self.goals]}
         try:
-            with open(self.goals_path, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2)
+            if orjson is not None:
+                payload = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+            else:
+                payload = json.dumps(data, indent=2).encode('utf-8')
+            # Write aside and swap in, so readers never see a half-written file
+            tmp_path = self.goals_path.with_name(self.goals_path.name + ".tmp")
+            with open(tmp_path, 'wb') as f:
+                f.write(payload)
+            os.replace(tmp_path, self.goals_path)
+            # Statuses are now in the main file
+            self._done_log_path.unlink(missing_ok=True)
         except Exception as e: # Catch any file-related errors
-            self.logger.error(f"Error saving goals to {self.goals_path}: {e}")
+            self.logger.error("Error saving goals to %s: %s", self.goals_path, e)
 
     def next_goal(self) -> Optional[Goal]:
         """Returns the next pending goal, or None if no more pending goals."""
@@ -78,24 +145,47 @@ class GoalManager:
         self._current_goal_index = len(self.goals) # Set index to end if no more pending goals
         return None
 
+    def next_goals(self, count: int) -> List[Goal]:
+        """Returns up to count pending goals, advancing past them like next_goal."""
+        goals: List[Goal] = []
+        while len(goals) < count:
+            goal = self.next_goal()
+            if goal is None:
+                break
+            goals.append(goal)
+        return goals
+
     def mark_done(self, goal_id: str):
         """Marks a goal as completed."""
-        for goal in self.goals:
-            if goal.goal_id == goal_id:
-                goal.status = "completed"
-                self.save_goals()
-                self.logger.info(f"Goal '{goal_id}' marked as completed.")
-                return
-        self.logger.warning(f"Goal '{goal_id}' not found when trying to mark as done.")
+        goal = self._goals_by_id.get(goal_id)
+        if goal is None:
+            self.logger.warning("Goal '%s' not found when trying to mark as done.", goal_id)
+            return
+        goal.status = "completed"
+        try:
+            with open(self._done_log_path, 'a', encoding='utf-8') as f:
+                # Leading newline: never continue a line a crashed append left partial
+                f.write("\n" + json.dumps({"id": goal_id}))
+        except Exception as e: # Catch any file-related errors
+            self.logger.error("Error recording completion of goal '%s' in %s: %s", goal_id, self._done_log_path, e)
+        self.logger.info("Goal '%s' marked as completed.", goal_id)
 
     def add_goal(self, goal: Goal):
         """Adds a new goal to the manager."""
-        self.goals.append(goal)
+        self._append(goal)
+        self.save_goals()
+        self.logger.info("Added new goal: %s", goal.goal_id)
+
+    def add_goals(self, goals: List[Goal]):
+        """Adds several goals with a single save of the goals file."""
+        for goal in goals:
+            self._append(goal)
         self.save_goals()
-        self.logger.info(f"Added new goal: {goal.goal_id}")
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info("Added %d new goals: %s", len(goals), ", ".join(goal.goal_id for goal in goals))
 
     def add_goal_from_dict(self, goal_data: Dict[str, Any]):
         """Adds a new goal from a dictionary."""
-        self.goals.append(Goal(goal_data["id"], goal_data["description"], goal_data.get("status", "pending")))
+        self._append(Goal(goal_data["id"], goal_data["description"], goal_data.get("status", "pending")))
         self.save_goals()
-        self.logger.info(f"Added new goal: {goal_data['id']}")
+        self.logger.info("Added new goal: %s", goal_data['id'])
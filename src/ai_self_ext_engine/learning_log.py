@@ -1,6 +1,61 @@
+import atexit
 import json
+import os
+import threading
+import weakref
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import Any, BinaryIO, Dict, List, Optional
+
+try:
+    import orjson
+except ImportError:  # stdlib fallback keeps minimal environments working
+    orjson = None
+
+if orjson is not None:
+    def _dumps_line(entry: Dict[str, Any]) -> bytes:
+        return orjson.dumps(entry, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE)
+    _loads = orjson.loads
+else:
+    def _dumps_line(entry: Dict[str, Any]) -> bytes:
+        return (json.dumps(entry) + "\n").encode("utf-8")
+    _loads = json.loads
+
+
+_TAIL_CHUNK = 64 * 1024
+
+
+def _tail_lines(f: BinaryIO, count: int) -> List[bytes]:
+    """
+    Returns the last count non-empty lines of a binary file, reading backwards
+    in chunks so the rest of the file is never read or decoded.
+    """
+    end = f.seek(0, os.SEEK_END)
+    buf = b""
+    while end > 0:
+        start = max(0, end - _TAIL_CHUNK)
+        f.seek(start)
+        buf = f.read(end - start) + buf
+        end = start
+        # More than count newlines means the oldest line needed is complete
+        if buf.count(b"\n") > count:
+            break
+    lines = [line for line in buf.splitlines() if line.strip()]
+    return lines[-count:]
+
+
+# Live logs, so a read sees what any instance has buffered for the same file
+# and buffered entries are written at interpreter exit
+_live_logs: "weakref.WeakSet[LearningLog]" = weakref.WeakSet()
+
+
+def _flush_live_logs(log_file: Optional[str] = None) -> None:
+    """Flushes every live log, or only those appending to log_file."""
+    for log in list(_live_logs):
+        if log_file is None or log._log_file_str == log_file:
+            log.flush()
+
+
+atexit.register(_flush_live_logs)
 
 
 class LearningLog:
@@ -8,18 +63,61 @@ class LearningLog:
     Manages a log of self-improvement cycles to facilitate learning.
     """
 
-    def __init__(self, log_dir: Path):
+    def __init__(self, log_dir: Path, max_buffered: int = 8):
         self.log_dir = log_dir
         self.log_dir.mkdir(parents=True, exist_ok=True)
         self.log_file = self.log_dir / "learning_log.jsonl"
+        # Serialized lines not yet appended; written in one go by flush()
+        self._pending: List[bytes] = []
+        self._max_buffered = max_buffered
+        self._log_file_str = os.path.abspath(self.log_file)
+        # Guards _pending: roles on concurrent goals may record or load (and so
+        # flush) from several threads
+        self._lock = threading.Lock()
+        _live_logs.add(self)
 
     def record_entry(self, entry: Dict[str, Any]):
         """
         Appends a new learning entry to the log file.
         Each entry is a JSON object on a new line.
+        Entries are buffered and written every max_buffered entries or on flush().
+        """
+        # Serialize now: callers may keep mutating the entry
+        line = _dumps_line(entry)
+        with self._lock:
+            self._pending.append(line)
+            full = len(self._pending) >= self._max_buffered
+        if full:
+            self.flush()
+
+    def record_entries(self, entries: List[Dict[str, Any]]):
         """
-        with self.log_file.open("a", encoding="utf-8") as f:
-            f.write(json.dumps(entry) + "\n")
+        Appends several learning entries, flushing at most once.
+        """
+        lines = [_dumps_line(entry) for entry in entries]
+        with self._lock:
+            self._pending.extend(lines)
+            full = len(self._pending) >= self._max_buffered
+        if full:
+            self.flush()
+
+    def flush(self):
+        """
+        Appends all buffered entries to the log file with a single write.
+        """
+        # Held while writing, so batches from different threads land in order
+        with self._lock:
+            if not self._pending:
+                return
+            data = b"".join(self._pending)
+            self._pending.clear()
+            fd = os.open(self.log_file, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+            try:
+                view = memoryview(data)
+                while view:
+                    view = view[os.write(fd, view):]
+            finally:
+                os.close(fd)
 
     def load_entries(
         self, max_entries: Optional[int] = None
@@ -28,17 +126,17 @@ class LearningLog:
         Loads learning entries from the log file.
         Returns a list of the most recent entries.
         """
+        # Include entries still buffered here or in other logs on this file
+        _flush_live_logs(self._log_file_str)
         if not self.log_file.exists():
             return []
 
-        entries = []
-        with self.log_file.open("r", encoding="utf-8") as f:
-            for line in f:
-                entries.append(json.loads(line))
-
-        if max_entries:
-            return entries[-max_entries:]
-        return entries
+        with self.log_file.open("rb") as f:
+            if max_entries:
+                lines = _tail_lines(f, max_entries)
+            else:
+                lines = f.read().splitlines()
+        return [_loads(line) for line in lines if line]
 
 
 def create_learning_entry(
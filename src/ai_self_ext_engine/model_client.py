@@ -1,6 +1,7 @@
+import asyncio
 import logging  # Import logging
 import os
-from typing import Any, Dict, List, Optional
+from typing import Any, ClassVar, Dict, List, Optional
 
 import google.generativeai as genai
 
@@ -15,6 +16,9 @@ class ModelClient:
     """
     Handles interactions with the Gemini API for various model calls.
     """
+    # genai.configure is process-global; the key it was last called with
+    _configured_key: ClassVar[Optional[str]] = None
+
     def __init__(self, config: ModelSectionConfig): # Accept ModelSectionConfig
         self.config = config
         self.logger = logging.getLogger(__name__) # Get logger for ModelClient
@@ -22,11 +26,28 @@ class ModelClient:
             api_key = os.environ.get(self.config.api_key_env)
             if not api_key:
                 raise ValueError(f"Environment variable '{self.config.api_key_env}' not set.")
-            genai.configure(api_key=api_key)
+            if api_key != ModelClient._configured_key:
+                genai.configure(api_key=api_key)
+                ModelClient._configured_key = api_key
             self._configured = True
         except Exception as e:
             self.logger.error("Error configuring Gemini API: %s", e)
             raise ValueError(f"Error configuring Gemini API: {e}")
+        # GenerativeModel instances by model name, reused across calls
+        self._models: Dict[str, genai.GenerativeModel] = {}
+
+    def _get_model(self, model_name: str) -> genai.GenerativeModel:
+        model = self._models.get(model_name)
+        if model is None:
+            model = self._models[model_name] = genai.GenerativeModel(model_name)
+        return model
+
+    @staticmethod
+    def _full_prompt(prompt: str, system_prompt: Optional[str]) -> str:
+        # Construct prompt with system prompt if provided
+        if system_prompt:
+            return f"System: {system_prompt}\n\nUser: {prompt}"
+        return prompt
 
     def call_model(
         self,
@@ -40,19 +61,13 @@ class ModelClient:
         Makes a call to the specified Gemini model with prompt and system prompt.
         """
         if dry_run:
-            self.logger.info(f"Dry run: Model '{model_name}' would be called with prompt:\n{prompt}")
+            self.logger.info("Dry run: Model '%s' would be called with prompt:\n%s", model_name, prompt)
             return "DRY_RUN_RESPONSE"
 
         try:
-            # Create model instance
-            model = genai.GenerativeModel(model_name)
-            
-            # Construct prompt with system prompt if provided
-            full_prompt = prompt
-            if system_prompt:
-                full_prompt = f"System: {system_prompt}\n\nUser: {prompt}"
-
-            response = model.generate_content(full_prompt, **kwargs)
+            response = self._get_model(model_name).generate_content(
+                self._full_prompt(prompt, system_prompt), **kwargs
+            )
             
             if response.text is None:
                 raise ModelCallError(f"Model '{model_name}' returned no text response.")
@@ -62,3 +77,39 @@ class ModelClient:
         except Exception as e:
             self.logger.error("Failed to call model '%s': %s", model_name, e)
             raise ModelCallError(f"Failed to call model '{model_name}': {e}")
+
+    async def call_model_async(
+        self,
+        model_name: str,
+        prompt: str,
+        system_prompt: Optional[str] = None,
+        dry_run: bool = False,
+        **kwargs
+    ) -> str:
+        """
+        Async variant of call_model, so independent calls can overlap.
+        """
+        if dry_run:
+            self.logger.info("Dry run: Model '%s' would be called with prompt:\n%s", model_name, prompt)
+            return "DRY_RUN_RESPONSE"
+
+        try:
+            response = await self._get_model(model_name).generate_content_async(
+                self._full_prompt(prompt, system_prompt), **kwargs
+            )
+
+            if response.text is None:
+                raise ModelCallError(f"Model '{model_name}' returned no text response.")
+
+            return response.text
+
+        except Exception as e:
+            self.logger.error("Failed to call model '%s': %s", model_name, e)
+            raise ModelCallError(f"Failed to call model '{model_name}': {e}")
+
+    async def call_models_batch(self, requests: List[Dict[str, Any]]) -> List[str]:
+        """
+        Runs independent calls concurrently. Each request holds the keyword
+        arguments for call_model_async; responses come back in request order.
+        """
+        return await asyncio.gather(*(self.call_model_async(**request) for request in requests))
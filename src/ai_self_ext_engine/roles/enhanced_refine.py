@@ -32,6 +32,8 @@ class EnhancedRefineRole(Role):
     - Provide structured feedback to improve other roles
     - Track and report its own performance metrics
     """
+    # Engine passes its LearningLog to roles that declare this
+    requires_learning_log = True
 
     def __init__(self, config: MainConfig, model_client: ModelClient, learning_log: LearningLog):
         self.config = config
@@ -10,7 +10,7 @@ import json
 import logging
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from ai_self_ext_engine.config import MainConfig
 from ai_self_ext_engine.core.role import Context, Role
@@ -19,6 +19,10 @@ from ai_self_ext_engine.model_client import ModelCallError, ModelClient
 
 logger = logging.getLogger(__name__)
 
+# Per-file metrics keyed by path, with the (st_mtime_ns, st_size) they were
+# computed for. Module-level because the engine creates a new role per run.
+_FILE_METRICS_CACHE: Dict[str, Tuple[Tuple[int, int], Optional[Dict[str, Any]]]] = {}
+
 
 @dataclass
 class CodeMetrics:
@@ -142,7 +146,23 @@ class GoalGenerationRole(Role):
         return metrics
 
     def _analyze_single_file(self, py_file: Path) -> Optional[Dict[str, Any]]:
-        """Analyze a single Python file for metrics."""
+        """Analyze a single Python file for metrics, reusing results for unchanged files."""
+        try:
+            st = py_file.stat()
+        except OSError as e:
+            logger.warning(f"Could not analyze {py_file}: {e}")
+            return None
+        cache_key = str(py_file)
+        stamp = (st.st_mtime_ns, st.st_size)
+        cached = _FILE_METRICS_CACHE.get(cache_key)
+        if cached is not None and cached[0] == stamp:
+            return cached[1]
+        file_data = self._analyze_file_contents(py_file)
+        _FILE_METRICS_CACHE[cache_key] = (stamp, file_data)
+        return file_data
+
+    def _analyze_file_contents(self, py_file: Path) -> Optional[Dict[str, Any]]:
+        """Read and parse a single Python file for metrics."""
         try:
             with open(py_file, "r", encoding="utf-8") as f:
                 content = f.read()
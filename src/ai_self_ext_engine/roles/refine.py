@@ -18,6 +18,9 @@ logger = logging.getLogger(__name__)
 
 
 class RefineRole(Role):
+    # Engine passes its LearningLog to roles that declare this
+    requires_learning_log = True
+
     def __init__(
         self,
         config: MainConfig,
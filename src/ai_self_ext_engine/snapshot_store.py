@@ -1,20 +1,68 @@
 import json
 import os # Import os
+import threading
 from pathlib import Path
 from typing import Any, Dict, Optional
 from datetime import datetime
 
+try:
+    import orjson
+except ImportError:  # stdlib fallback keeps minimal environments working
+    orjson = None
+
 # Assuming Context is defined in ai_self_ext_engine.core.role
 from ai_self_ext_engine.core.role import Context
 
+def _dumps(data: Dict[str, Any], pretty: bool = False) -> bytes:
+    """Serialize a snapshot to UTF-8 JSON (compact unless pretty), preferring orjson."""
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if pretty else 0)
+        return orjson.dumps(data, option=option)
+    if pretty:
+        return json.dumps(data, indent=2).encode('utf-8')
+    return json.dumps(data, separators=(",", ":")).encode('utf-8')
+
+def _loads(raw: bytes) -> Any:
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
 class SnapshotStore:
     """
     Manages the storage and retrieval of improvement cycle snapshots.
     Each snapshot includes code, critiques, and other relevant metadata.
     """
-    def __init__(self, memory_path: str):
+    __slots__ = ("memory_dir", "_memory_dir_str", "pretty", "_pending", "_max_buffered",
+                 "_max_delay", "_timer", "_latest", "_lock")
+
+    def __init__(self, memory_path: str, max_buffered: int = 8, pretty: bool = False,
+                 max_delay: Optional[float] = 1.0):
         self.memory_dir = Path(memory_path) # Use relative path
         self.memory_dir.mkdir(parents=True, exist_ok=True) # Ensure directory exists
+        self._memory_dir_str = str(self.memory_dir) # For os.path joins on hot paths
+        # Snapshots are machine-read; indentation is opt-in for debugging
+        self.pretty = pretty
+        # Serialized snapshots not yet written to disk, keyed by file path.
+        # record() buffers; flush() (or leaving the context manager) writes them.
+        self._pending: Dict[str, bytes] = {}
+        self._max_buffered = max_buffered
+        # Seconds a snapshot may wait in the buffer before a background flush,
+        # bounding what a crash loses; None leaves it to flush()
+        self._max_delay = max_delay
+        self._timer: Optional[threading.Timer] = None
+        # Newest snapshot file per goal directory, as written by flush() or
+        # found by load_latest(), so repeat loads skip the directory listing.
+        # Only this instance updates it: snapshots another process writes to
+        # the same memory_path are not seen while the cached file still reads.
+        self._latest: Dict[str, str] = {}
+        # Guards _pending: goals may record and load from several threads
+        self._lock = threading.Lock()
+
+    def __enter__(self) -> "SnapshotStore":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.flush()
 
     def record(self, context: Context):
         """
@@ -25,12 +73,12 @@ class SnapshotStore:
             print("Cannot record snapshot: No goal in context.")
             return
 
-        goal_snapshot_dir = self.memory_dir / context.goal.goal_id
-        goal_snapshot_dir.mkdir(parents=True, exist_ok=True) # Ensure goal-specific directory exists
+        goal_snapshot_dir = os.path.join(self._memory_dir_str, context.goal.goal_id)
+        os.makedirs(goal_snapshot_dir, exist_ok=True) # Ensure goal-specific directory exists
 
         # Sanitize timestamp for filename: replace colons with hyphens
         timestamp = context.metadata.get("timestamp", datetime.now().isoformat()).replace(":", "-")
-        snapshot_file_path = os.path.join(str(goal_snapshot_dir), f"{timestamp}.json")
+        snapshot_file_path = os.path.join(goal_snapshot_dir, timestamp + ".json")
         
         # Prepare data for serialization
         snapshot_data = {
@@ -47,48 +95,121 @@ class SnapshotStore:
         }
 
         try:
-            with open(snapshot_file_path, 'w', encoding='utf-8') as f: # Use the new path variable
-                json.dump(snapshot_data, f, indent=2)
-            print(f"Snapshot recorded for goal '{context.goal.goal_id}' at {snapshot_file_path}")
+            # Serialize now: the context keeps being mutated after this call
+            payload = _dumps(snapshot_data, self.pretty)
         except Exception as e:
             print(f"Error recording snapshot for goal '{context.goal.goal_id}': {e}")
+            return
+        with self._lock:
+            self._pending[snapshot_file_path] = payload
+            full = len(self._pending) >= self._max_buffered
+            if not full and self._timer is None and self._max_delay is not None:
+                self._timer = threading.Timer(self._max_delay, self.flush)
+                self._timer.daemon = True
+                self._timer.start()
+        if full:
+            self.flush()
+
+    def flush(self):
+        """
+        Writes all buffered snapshots to disk in one pass, fsyncing each file.
+        """
+        # Held while writing, so readers never see a snapshot that has left
+        # the buffer but is not on disk yet
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()  # no-op when the timer itself is flushing
+                self._timer = None
+            self._write(self._pending)
+            self._pending = {}
+
+    def _write(self, pending: Dict[str, bytes]):
+        for snapshot_file_path, payload in pending.items():
+            try:
+                fd = os.open(snapshot_file_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+                try:
+                    view = memoryview(payload)
+                    while view:
+                        view = view[os.write(fd, view):]
+                    os.fsync(fd)
+                finally:
+                    os.close(fd)
+                self._latest[os.path.dirname(snapshot_file_path)] = snapshot_file_path
+                print(f"Snapshot recorded at {snapshot_file_path}")
+            except Exception as e:
+                print(f"Error recording snapshot at {snapshot_file_path}: {e}")
 
     def has(self, goal: Any) -> bool:
         """
         Checks if a snapshot for a given goal already exists.
         For simplicity, it just checks if the goal's directory exists and is not empty.
         """
-        goal_snapshot_dir = self.memory_dir / goal.goal_id
-        return goal_snapshot_dir.exists() and any(goal_snapshot_dir.iterdir())
+        goal_snapshot_dir = os.path.join(self._memory_dir_str, goal.goal_id)
+        if self._pending_for(goal_snapshot_dir):
+            return True
+        try:
+            with os.scandir(goal_snapshot_dir) as it:
+                return any(True for _ in it)
+        except (FileNotFoundError, NotADirectoryError):
+            return False
+
+    def _pending_for(self, goal_snapshot_dir: str) -> list:
+        """Buffered payloads belonging to a goal directory, newest last."""
+        prefix = os.path.join(goal_snapshot_dir, "")
+        with self._lock:
+            return [payload for path, payload in self._pending.items() if path.startswith(prefix)]
 
     def load_latest(self, goal_id: str) -> Optional[Context]:
         """
         Loads the latest snapshot for a given goal.
-        (Implementation can be more sophisticated to find actual latest by timestamp)
+        Snapshot file names are timestamps, so the newest sorts last.
+        Assumes this store is the only writer to its memory_path: once a
+        goal's newest file is cached, snapshots written by other processes
+        are not picked up.
         """
-        goal_snapshot_dir = self.memory_dir / goal_id
-        if not goal_snapshot_dir.exists():
+        goal_snapshot_dir = os.path.join(self._memory_dir_str, goal_id)
+        # Snapshots still in the write buffer are newer than anything on disk
+        pending = self._pending_for(goal_snapshot_dir)
+        if pending:
+            return self._context_from_data(_loads(pending[-1]))
+        latest = self._latest.get(goal_snapshot_dir)
+        if latest is not None:
+            context = self._read_snapshot(latest)
+            if context is not None:
+                return context
+        try:
+            names = os.listdir(goal_snapshot_dir)
+        except (FileNotFoundError, NotADirectoryError):
             return None
-        
-        # For simplicity, just pick the first json file found
-        for f in goal_snapshot_dir.iterdir():
-            if f.suffix == ".json":
-                try:
-                    with open(f, 'r', encoding='utf-8') as sf:
-                        data = json.load(sf)
-                        # Reconstruct Context object (simplified)
-                        context = Context(
-                            code_dir=data.get("code_dir", "."), # Assuming code_dir is stored
-                            current_code=data.get("current_code"),
-                            goal=None, # Need to load Goal object separately if needed
-                            todos=data.get("todos", []),
-                            patch=data.get("patch"),
-                            test_results=data.get("test_results"),
-                            accepted=data.get("accepted", False),
-                            should_abort=data.get("should_abort", False),
-                            metadata=data.get("metadata", {})
-                        )
-                        return context
-                except Exception as e:
-                    print(f"Error loading snapshot from {f}: {e}")
+
+        for name in sorted((n for n in names if n.endswith(".json")), reverse=True):
+            f = os.path.join(goal_snapshot_dir, name)
+            context = self._read_snapshot(f)
+            if context is not None:
+                self._latest[goal_snapshot_dir] = f
+                return context
         return None
+
+    def _read_snapshot(self, f: str) -> Optional[Context]:
+        try:
+            # Unbuffered: read() becomes one fstat-sized readall, no BufferedReader copy
+            with open(f, 'rb', buffering=0) as sf:
+                return self._context_from_data(_loads(sf.read()))
+        except Exception as e:
+            print(f"Error loading snapshot from {f}: {e}")
+            return None
+
+    @staticmethod
+    def _context_from_data(data: Dict[str, Any]) -> Context:
+        # Reconstruct Context object (simplified)
+        return Context(
+            code_dir=data.get("code_dir", "."), # Assuming code_dir is stored
+            current_code=data.get("current_code"),
+            goal=None, # Need to load Goal object separately if needed
+            todos=data.get("todos", []),
+            patch=data.get("patch"),
+            test_results=data.get("test_results"),
+            accepted=data.get("accepted", False),
+            should_abort=data.get("should_abort", False),
+            metadata=data.get("metadata", {})
+        )
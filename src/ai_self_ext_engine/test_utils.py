@@ -1,5 +1,5 @@
-import subprocess
 import logging
+import xml.etree.ElementTree as ET
 from pathlib import Path
 from typing import Optional, Dict, Any
 
@@ -30,17 +30,24 @@ def run_tests(
         - 'stderr': str, The standard error from the pytest command.
         - 'coverage_xml_path': Optional[Path], The path to the generated coverage XML report,
                                if requested and successfully created.
+        - 'coverage_data': Optional[dict], Overall and per-file metrics parsed from
+                           that report (see _parse_coverage_xml).
     """
+    # Imported here so importing this module (e.g. from cli) stays cheap
+    import subprocess
+    import sys
+
     results: Dict[str, Any] = {
         'success': False,
         'stdout': '',
         'stderr': '',
-        'coverage_xml_path': None
+        'coverage_xml_path': None,
+        'coverage_data': None
     }
 
     # Ensure pytest is available
     try:
-        subprocess.run(["pytest", "--version"], check=True, capture_output=True)
+        subprocess.run([sys.executable, "-m", "pytest", "--version"], check=True, capture_output=True)
     except FileNotFoundError:
         logger.error("Pytest is not installed or not in PATH. Please install it (e.g., pip install pytest pytest-cov).")
         results['stderr'] = "Pytest not found."
@@ -50,8 +57,8 @@ def run_tests(
         results['stderr'] = f"Error checking pytest version: {e.stderr.decode()}"
         return results
 
-    # Construct the pytest command
-    cmd = ["pytest"]
+    # Construct the pytest command; `python -m` also puts project_root on sys.path
+    cmd = [sys.executable, "-m", "pytest"]
 
     if coverage_report_dir:
         # Ensure coverage directory exists
@@ -79,63 +86,70 @@ def run_tests(
         results['success'] = process.returncode == 0
         if results['success'] and coverage_report_dir:
             results['coverage_xml_path'] = coverage_xml_path
+            if coverage_xml_path.exists():
+                _parse_coverage_xml(coverage_xml_path, results)
     except Exception as e:
         logger.exception(f"An unexpected error occurred while running tests for {test_path}: {e}")
         results['stderr'] += f"\nAn unexpected error occurred: {e}"
 
-# AI-generated code improvements:
-import xml.etree.ElementTree as ET
-        'coverage_xml_path': None,
-        'coverage_data': None  # New key to store parsed coverage metrics
-            # --- Start: Coverage XML Parsing Logic ---
-            if coverage_xml_path.exists():
-                try:
-                    tree = ET.parse(coverage_xml_path)
-                    root = tree.getroot()
-                    coverage_data = {
-                        'overall': {
-                            'line_rate': 0.0,
-                            'lines_covered': 0,
-                            'lines_valid': 0
-                        },
-                        'files': []
-                    }
-                    # Parse overall coverage from <totals> or <coverage> root element
-                    totals_element = root.find('totals')
-                    source_element = totals_element if totals_element is not None else root
-                    coverage_data['overall'] = {
-                        'line_rate': float(source_element.get('line-rate', 0.0)),
-                        'lines_covered': int(source_element.get('lines-covered', 0)),
-                        'lines_valid': int(source_element.get('lines-valid', 0))
-                    }
-                    # Parse per-file coverage
-                    for package_elem in root.findall('packages/package'):
-                        for class_elem in package_elem.findall('classes/class'):
-                            filename = class_elem.get('filename')
-                            if filename:
-                                file_line_rate = float(class_elem.get('line-rate', 0.0))
-                                file_lines_covered = int(class_elem.get('lines-covered', 0))
-                                file_lines_valid = int(class_elem.get('lines-valid', 0))
-                                missing_lines = []
-                                for line_elem in class_elem.findall('lines/line'):
-                                    if line_elem.get('hits') == '0':
-                                        try:
-                                            missing_lines.append(int(line_elem.get('number')))
-                                        except (ValueError, TypeError):
-                                            pass
-                                coverage_data['files'].append({
-                                    'filename': filename,
-                                    'line_rate': file_line_rate,
-                                    'lines_covered': file_lines_covered,
-                                    'lines_valid': file_lines_valid,
-                                    'missing_lines': sorted(missing_lines)
-                                })
-                    results['coverage_data'] = coverage_data
-                    logger.info(f"Successfully parsed coverage XML from {coverage_xml_path}")
-                except ET.ParseError as pe:
-                    logger.warning(f"Failed to parse coverage XML from {coverage_xml_path}: {pe}")
-                    results['stderr'] += f"\nFailed to parse coverage XML: {pe}"
-                except Exception as parse_e:
-                    logger.warning(f"An error occurred while processing coverage XML from {coverage_xml_path}: {parse_e}")
-                    results['stderr'] += f"\nError processing coverage XML: {parse_e}"
-            # --- End: Coverage XML Parsing Logic ---
\ No newline at end of file
+    return results
+
+
+def run_tests_with_coverage(
+    project_root: Path,
+    test_path: Path,
+    coverage_report_dir: Path
+) -> Dict[str, Any]:
+    """
+    Runs the tests at test_path with coverage measured over project_root,
+    writing the XML report into coverage_report_dir. Returns run_tests' results.
+    """
+    return run_tests(project_root, test_path, coverage_report_dir=coverage_report_dir)
+
+
+def _parse_coverage_xml(coverage_xml_path: Path, results: Dict[str, Any]) -> None:
+    """
+    Parses a Cobertura coverage XML report into results['coverage_data'].
+    Parse failures are logged and appended to results['stderr'].
+    """
+    try:
+        tree = ET.parse(coverage_xml_path)
+        root = tree.getroot()
+        coverage_data: Dict[str, Any] = {'files': []}
+        # Parse overall coverage from <totals> or <coverage> root element
+        totals_element = root.find('totals')
+        source_element = totals_element if totals_element is not None else root
+        coverage_data['overall'] = {
+            'line_rate': float(source_element.get('line-rate', 0.0)),
+            'lines_covered': int(source_element.get('lines-covered', 0)),
+            'lines_valid': int(source_element.get('lines-valid', 0))
+        }
+        # Parse per-file coverage
+        for package_elem in root.findall('packages/package'):
+            for class_elem in package_elem.findall('classes/class'):
+                filename = class_elem.get('filename')
+                if not filename:
+                    continue
+                missing_lines = []
+                for line_elem in class_elem.findall('lines/line'):
+                    if line_elem.get('hits') == '0':
+                        try:
+                            missing_lines.append(int(line_elem.get('number')))
+                        except (ValueError, TypeError):
+                            pass
+                coverage_data['files'].append({
+                    'filename': filename,
+                    'line_rate': float(class_elem.get('line-rate', 0.0)),
+                    'lines_covered': int(class_elem.get('lines-covered', 0)),
+                    'lines_valid': int(class_elem.get('lines-valid', 0)),
+                    'missing_lines': sorted(missing_lines)
+                })
+        results['coverage_data'] = coverage_data
+        logger.info(f"Successfully parsed coverage XML from {coverage_xml_path}")
+    except ET.ParseError as pe:
+        logger.warning(f"Failed to parse coverage XML from {coverage_xml_path}: {pe}")
+        results['stderr'] += f"\nFailed to parse coverage XML: {pe}"
+    except Exception as parse_e:
+        logger.warning(f"An error occurred while processing coverage XML from {coverage_xml_path}: {parse_e}")
+        results['stderr'] += f"\nError processing coverage XML: {parse_e}"
+
@@ -0,0 +1,73 @@
+import pytest
+import yaml
+
+from ai_self_ext_engine import cli
+
+CONFIG_YAML = """
+engine:
+  code_dir: ./code
+  max_cycles: 5
+model:
+  api_key_env: TEST_API_KEY
+roles: []
+logging: {}
+"""
+
+
+@pytest.fixture
+def config_file(tmp_path, monkeypatch):
+    """A config file, with the on-disk cache redirected into tmp_path and the memo cleared."""
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+    monkeypatch.setattr(cli, "_CONFIG_CACHE", {})
+    config_path = tmp_path / "engine_config.yaml"
+    config_path.write_text(CONFIG_YAML)
+    return config_path
+
+
+def _forbid_yaml(monkeypatch):
+    def fail(*args, **kwargs):
+        raise AssertionError("config was parsed from YAML instead of the cache")
+    monkeypatch.setattr(yaml, "load", fail)
+
+
+def test_cache_is_written_under_xdg_cache_home(config_file, tmp_path):
+    """Test that the validated config is cached in XDG_CACHE_HOME, without defaults."""
+    cli._load_config(config_file)
+
+    cache_path = cli._config_cache_path(str(config_file))
+    assert tmp_path / "cache" in cache_path.parents
+    cached = cache_path.read_text()
+    assert '"max_cycles":5' in cached
+    # Defaults are left to MainConfig on load, not frozen into the cache
+    assert "max_concurrent_goals" not in cached
+
+
+def test_cached_config_is_reused(config_file, monkeypatch):
+    """Test that a second process (empty memo) loads the config from the cache."""
+    config = cli._load_config(config_file)
+    monkeypatch.setattr(cli, "_CONFIG_CACHE", {})
+    _forbid_yaml(monkeypatch)
+
+    assert cli._load_config(config_file) == config
+
+
+def test_cache_is_ignored_after_schema_change(config_file, monkeypatch):
+    """Test that a different MainConfig schema fingerprint forces a fresh YAML load."""
+    cli._load_config(config_file)
+    monkeypatch.setattr(cli, "_CONFIG_CACHE", {})
+    monkeypatch.setattr(cli, "_config_schema_digest", lambda: "changed")
+    loads = []
+    real_load = yaml.load
+    monkeypatch.setattr(yaml, "load", lambda *args, **kwargs: loads.append(1) or real_load(*args, **kwargs))
+
+    assert cli._load_config(config_file).engine.max_cycles == 5
+    assert loads == [1]
+
+
+def test_cache_is_ignored_after_config_edit(config_file, monkeypatch):
+    """Test that editing the YAML file invalidates its cached copy."""
+    cli._load_config(config_file)
+    monkeypatch.setattr(cli, "_CONFIG_CACHE", {})
+    config_file.write_text(CONFIG_YAML.replace("max_cycles: 5", "max_cycles: 10"))
+
+    assert cli._load_config(config_file).engine.max_cycles == 10
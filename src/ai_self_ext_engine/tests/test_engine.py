@@ -0,0 +1,203 @@
+import asyncio
+import json
+import threading
+import time
+
+import pytest
+
+from ai_self_ext_engine.config import load_config
+from ai_self_ext_engine.core.engine import Engine
+from ai_self_ext_engine.core.role import Context
+from ai_self_ext_engine.goal_manager import Goal
+
+
+class BarrierRole:
+    """Completes a goal only once another goal reaches the same point."""
+    concurrent_goals_safe = True
+    barrier = threading.Barrier(2, timeout=5)
+    instances = []
+
+    def __init__(self, config, model_client):
+        BarrierRole.instances.append(self)
+
+    def run(self, context: Context) -> Context:
+        self.barrier.wait()  # times out unless two goals run at once
+        context.accepted = True
+        return context
+
+
+class CountingRole:
+    """Counts instantiations, to observe when the engine creates roles."""
+    created = 0
+
+    def __init__(self, config, model_client):
+        CountingRole.created += 1
+
+    def run(self, context: Context) -> Context:
+        context.accepted = True
+        return context
+
+
+class BadSignatureRole:
+    """A role whose constructor doesn't take the engine's arguments."""
+
+    def __init__(self):
+        pass
+
+
+EVENTS = []
+
+
+class FirstRole:
+    """Records when it runs; the other ordered roles follow the same pattern."""
+
+    def __init__(self, config, model_client):
+        pass
+
+    def run(self, context: Context) -> Context:
+        EVENTS.append(("start", type(self).__name__))
+        time.sleep(0.05)
+        EVENTS.append(("end", type(self).__name__))
+        return context
+
+
+class IndependentRole(FirstRole):
+    pass
+
+
+class LastRole(FirstRole):
+    def run(self, context: Context) -> Context:
+        context = super().run(context)
+        context.accepted = True
+        return context
+
+
+class SharedStateRole:
+    """A role that has not opted in to concurrent goals."""
+
+    def __init__(self, config, model_client):
+        pass
+
+    def run(self, context: Context) -> Context:
+        context.accepted = True
+        return context
+
+
+def _role(role_class, module=__name__, **options):
+    """A role config entry; role_class may be a class or a class name."""
+    class_name = role_class if isinstance(role_class, str) else role_class.__name__
+    return {"module": module, "class": class_name, "prompt_path": "unused.tpl", **options}
+
+
+def _make_engine(tmp_path, monkeypatch, roles, **engine_options):
+    """Builds an Engine over two pending goals, with goal generation disabled."""
+    monkeypatch.setenv("TEST_ENGINE_API_KEY", "test-key")
+    goals_path = tmp_path / "goals.json"
+    goals_path.write_text(json.dumps([
+        {"id": "g1", "description": "First goal"},
+        {"id": "g2", "description": "Second goal"},
+    ]))
+    config = load_config({
+        "engine": {
+            "code_dir": str(tmp_path / "code"),
+            "memory_path": str(tmp_path / "memory"),
+            "goals_path": str(goals_path),
+            **engine_options,
+        },
+        "model": {"api_key_env": "TEST_ENGINE_API_KEY"},
+        "roles": roles,
+        "logging": {},
+    })
+    engine = Engine(config)
+    monkeypatch.setattr(engine, "_attempt_autonomous_goal_generation", lambda: False)
+    return engine
+
+
+def test_runs_two_goals_at_once(tmp_path, monkeypatch):
+    """Test that two goals run concurrently, each with its own role instance."""
+    BarrierRole.barrier.reset()
+    engine = _make_engine(tmp_path, monkeypatch, [_role(BarrierRole)], max_concurrent_goals=2)
+    BarrierRole.instances = []
+
+    engine.run_cycles()
+
+    assert [goal.status for goal in engine.goal_manager.goals] == ["completed", "completed"]
+    # One per goal, none shared with self.roles
+    assert len(BarrierRole.instances) == 2
+    assert BarrierRole.instances[0] is not BarrierRole.instances[1]
+
+
+def test_concurrent_goals_require_opted_in_roles(tmp_path, monkeypatch):
+    """Test that concurrent goals are refused for roles without concurrent_goals_safe."""
+    engine = _make_engine(tmp_path, monkeypatch, [_role(SharedStateRole)], max_concurrent_goals=2)
+
+    with pytest.raises(ValueError, match="SharedStateRole"):
+        engine.run_cycles()
+    assert [goal.status for goal in engine.goal_manager.goals] == ["pending", "pending"]
+
+
+def test_roles_are_instantiated_once_when_engine_is_built(tmp_path, monkeypatch):
+    """Test that roles are created by Engine() and reused across goals."""
+    CountingRole.created = 0
+    engine = _make_engine(tmp_path, monkeypatch, [_role(CountingRole)])
+
+    assert CountingRole.created == 1
+    assert type(engine.roles[0]) is CountingRole
+    engine.run_cycles()
+    assert CountingRole.created == 1
+
+
+@pytest.mark.parametrize("role_module, role_class", [
+    ("ai_self_ext_engine.no_such_module", "CountingRole"),
+    (__name__, "NoSuchRole"),
+    (__name__, "BadSignatureRole"),
+])
+def test_bad_role_fails_engine_construction(tmp_path, monkeypatch, role_module, role_class):
+    """Test that a bad module or class name, or a bad constructor, fails when the engine is built."""
+    with pytest.raises((ImportError, AttributeError, TypeError)):
+        _make_engine(tmp_path, monkeypatch, [_role(role_class, module=role_module)])
+
+
+def test_concurrent_import_raises_first_failure(tmp_path, monkeypatch):
+    """Test that when several role modules fail to import, the first one's error is raised."""
+    with pytest.raises(ImportError, match="no_such_module_a"):
+        _make_engine(tmp_path, monkeypatch, [
+            _role("CountingRole", module="ai_self_ext_engine.no_such_module_a"),
+            _role("CountingRole", module="ai_self_ext_engine.no_such_module_b"),
+        ])
+
+
+def _ordered_roles_engine(tmp_path, monkeypatch):
+    """LastRole waits for FirstRole and IndependentRole, which may overlap."""
+    EVENTS.clear()
+    return _make_engine(tmp_path, monkeypatch, [
+        _role(FirstRole),
+        _role(IndependentRole, depends_on=[]),
+        _role(LastRole, depends_on=["FirstRole", "IndependentRole"]),
+    ], max_concurrent_roles=2)
+
+
+def test_depends_on_orders_roles(tmp_path, monkeypatch):
+    """Test that roles start only after their depends_on roles end, and others overlap."""
+    engine = _ordered_roles_engine(tmp_path, monkeypatch)
+
+    assert engine._execute_roles(Context(code_dir=".", goal=Goal("g", "d"))) == "completed"
+    assert EVENTS.index(("start", "LastRole")) > EVENTS.index(("end", "FirstRole"))
+    assert EVENTS.index(("start", "LastRole")) > EVENTS.index(("end", "IndependentRole"))
+    # Both independent roles started before either ended
+    assert {event for event, _ in EVENTS[:2]} == {"start"}
+
+
+def test_execute_roles_inside_running_loop_runs_in_order(tmp_path, monkeypatch):
+    """Test that a running event loop makes roles run one after another, not nest asyncio.run."""
+    engine = _ordered_roles_engine(tmp_path, monkeypatch)
+
+    async def call_from_loop():
+        return engine._execute_roles(Context(code_dir=".", goal=Goal("g", "d")))
+
+    assert asyncio.run(call_from_loop()) == "completed"
+    assert EVENTS == [
+        (event, name)
+        for name in ("FirstRole", "IndependentRole", "LastRole")
+        for event in ("start", "end")
+    ]
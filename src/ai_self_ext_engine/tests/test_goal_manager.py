@@ -1,5 +1,6 @@
 import pytest
 import json
+import os
 import logging # Import logging
 from pathlib import Path
 from unittest.mock import patch, MagicMock
@@ -91,6 +92,12 @@ def test_next_goal_pending(populated_goals_file):
     next_g = manager.next_goal()
     assert next_g is None # No more pending goals
 
+def test_next_goals(populated_goals_file):
+    """Test next_goals returns up to count pending goals."""
+    manager = GoalManager(str(populated_goals_file))
+    assert [g.goal_id for g in manager.next_goals(5)] == ["goal1", "goal2"]
+    assert manager.next_goals(5) == []
+
 def test_mark_done(populated_goals_file, caplog):
     """Test marking a goal as done."""
     with caplog.at_level(logging.INFO, logger='ai_self_ext_engine.goal_manager'):
@@ -125,3 +132,68 @@ def test_add_goal_from_dict(temp_goals_file):
     manager.add_goal_from_dict(goal_data)
     assert len(manager.goals) == 1
     assert manager.goals[0].goal_id == "dict_test"
+
+def test_mark_done_folded_into_goals_file_on_save(populated_goals_file):
+    """Test that completions logged by mark_done are written into the goals file by the next save."""
+    manager = GoalManager(str(populated_goals_file))
+    manager.mark_done("goal1")
+    done_log = populated_goals_file.with_name(populated_goals_file.name + ".done.jsonl")
+    assert done_log.exists()
+
+    manager.add_goal(Goal("goal4", "Description for goal 4"))
+    assert not done_log.exists()
+    with open(populated_goals_file, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    assert data["goals"][0]["status"] == "completed"
+
+def test_manual_edit_of_goals_file_overrides_done_log(populated_goals_file):
+    """Test that a goals file edited after mark_done keeps its own statuses."""
+    manager = GoalManager(str(populated_goals_file))
+    manager.mark_done("goal1")
+    done_log = populated_goals_file.with_name(populated_goals_file.name + ".done.jsonl")
+
+    # Hand edit: goal1 back to pending, saved after the completion was logged
+    with open(populated_goals_file, 'w', encoding='utf-8') as f:
+        json.dump({"goals": [{"id": "goal1", "description": "Retry goal 1", "status": "pending"}]}, f)
+    done_mtime = done_log.stat().st_mtime_ns
+    os.utime(populated_goals_file, ns=(done_mtime + 1_000_000, done_mtime + 1_000_000))
+
+    manager_reloaded = GoalManager(str(populated_goals_file))
+    assert manager_reloaded.goals[0].status == "pending"
+    assert not done_log.exists()
+
+def test_truncated_done_log_line_is_skipped(populated_goals_file, caplog):
+    """Test that a partial done-log line from a crashed append loses only that completion."""
+    manager = GoalManager(str(populated_goals_file))
+    manager.mark_done("goal1")
+    done_log = populated_goals_file.with_name(populated_goals_file.name + ".done.jsonl")
+    with open(done_log, 'a', encoding='utf-8') as f:
+        f.write('\n{"id": "go')  # crash mid-append
+
+    with caplog.at_level(logging.WARNING, logger='ai_self_ext_engine.goal_manager'):
+        manager_reloaded = GoalManager(str(populated_goals_file))
+    assert "done.jsonl" in caplog.text
+    assert [goal.status for goal in manager_reloaded.goals] == ["completed", "pending", "completed"]
+    # Readable completions were folded into the goals file, so later ones log cleanly
+    assert not done_log.exists()
+    manager_reloaded.mark_done("goal2")
+    assert [goal.status for goal in GoalManager(str(populated_goals_file)).goals] == ["completed"] * 3
+
+def test_unknown_goal_keys_are_reported(temp_goals_file, caplog):
+    """Test that keys Goal doesn't know are logged rather than silently dropped."""
+    with open(temp_goals_file, 'w', encoding='utf-8') as f:
+        json.dump([{"id": "goal1", "description": "d", "owner": "me"}], f)
+    with caplog.at_level(logging.WARNING, logger='ai_self_ext_engine.goal_manager'):
+        manager = GoalManager(str(temp_goals_file))
+    assert manager.goals[0].goal_id == "goal1"
+    assert "Goal 'goal1' has unknown keys ['owner']" in caplog.text
+
+def test_add_goals(temp_goals_file):
+    """Test adding several goals at once."""
+    manager = GoalManager(str(temp_goals_file))
+    manager.add_goals([Goal("bulk1", "First bulk goal"), Goal("bulk2", "Second bulk goal")])
+    assert [g.goal_id for g in manager.goals] == ["bulk1", "bulk2"]
+
+    with open(temp_goals_file, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    assert [g["id"] for g in data["goals"]] == ["bulk1", "bulk2"]
@@ -0,0 +1,63 @@
+import threading
+
+from ai_self_ext_engine import learning_log
+from ai_self_ext_engine.learning_log import LearningLog
+
+
+def _entry(i):
+    return {"goal": f"goal {i}", "success": i % 2 == 0}
+
+
+def test_entries_are_buffered_until_max_buffered(tmp_path):
+    """Test that entries reach the file only once max_buffered are pending."""
+    log = LearningLog(tmp_path, max_buffered=3)
+    log.record_entry(_entry(0))
+    log.record_entry(_entry(1))
+    assert not log.log_file.exists()
+
+    log.record_entry(_entry(2))
+    assert len(log.log_file.read_bytes().splitlines()) == 3
+
+
+def test_load_entries_sees_buffered_entries_of_other_logs(tmp_path):
+    """Test that a second log on the same file reads entries the first still buffers."""
+    writer = LearningLog(tmp_path)
+    writer.record_entries([_entry(0), _entry(1)])
+
+    assert LearningLog(tmp_path).load_entries() == [_entry(0), _entry(1)]
+
+
+def test_load_entries_tail_read(tmp_path, monkeypatch):
+    """Test that max_entries returns the newest entries, also across read chunks."""
+    monkeypatch.setattr(learning_log, "_TAIL_CHUNK", 16)  # force several chunks
+    log = LearningLog(tmp_path)
+    log.record_entries([_entry(i) for i in range(20)])
+
+    assert log.load_entries(max_entries=3) == [_entry(17), _entry(18), _entry(19)]
+    assert log.load_entries(max_entries=50) == [_entry(i) for i in range(20)]
+
+
+class _RacingBuffer(list):
+    """A pending buffer that gets an entry recorded from another thread while flush() clears it."""
+
+    def __init__(self, log, entry):
+        super().__init__(log._pending)
+        self.racer = threading.Thread(target=log.record_entry, args=(entry,))
+
+    def clear(self):
+        if self.racer.ident is None:  # first clear only
+            self.racer.start()
+            self.racer.join(timeout=0.2)  # blocks on the log's lock, if it has one
+        super().clear()
+
+
+def test_entry_recorded_during_flush_is_kept(tmp_path):
+    """Test that an entry recorded from another thread mid-flush is written, not dropped."""
+    log = LearningLog(tmp_path)
+    log.record_entry(_entry(0))
+    log._pending = buffer = _RacingBuffer(log, _entry(1))
+
+    log.flush()
+    buffer.racer.join()
+
+    assert log.load_entries() == [_entry(0), _entry(1)]
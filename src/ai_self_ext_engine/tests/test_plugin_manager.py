@@ -80,6 +80,12 @@ def test_register_plugin_type_error(plugin_manager):
     with pytest.raises(TypeError, match="Provided object is not an instance of BasePlugin"):
         plugin_manager.register_plugin(NonPlugin())
 
+def test_register_plugin_type_error_names_missing_attributes(plugin_manager):
+    class NamedOnly:
+        name = "NamedOnly"
+    with pytest.raises(TypeError, match="lacks callable execute"):
+        plugin_manager.register_plugin(NamedOnly())
+
 def test_register_plugin_overwrite_warning(plugin_manager, mock_plugin_class, caplog):
     mock_plugin_instance_1 = mock_plugin_class(value=1)
     mock_plugin_instance_2 = mock_plugin_class(value=2)
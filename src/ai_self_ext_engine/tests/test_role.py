@@ -0,0 +1,32 @@
+import dataclasses
+
+from ai_self_ext_engine.core.role import Context, FeedbackType, RoleFeedback, _iso_for_tick
+
+
+def _feedback(to_role, message):
+    return RoleFeedback("Sender", to_role, FeedbackType.SUGGESTION, message)
+
+
+def test_feedback_passed_to_constructor_is_indexed():
+    """Test that feedback given to Context() is returned by get_feedback_for_role."""
+    queue = [_feedback("RefineRole", "targeted"), _feedback(None, "broadcast"), _feedback("TestRole", "other")]
+    context = Context(code_dir=".", feedback_queue=queue)
+
+    assert [fb.message for fb in context.get_feedback_for_role("RefineRole")] == ["targeted", "broadcast"]
+    assert [fb.message for fb in context.get_feedback_for_role("TestRole")] == ["broadcast", "other"]
+
+
+def test_feedback_survives_dataclasses_replace():
+    """Test that a replaced Context keeps its feedback and indexes new additions after it."""
+    context = Context(code_dir=".")
+    context.add_feedback(_feedback("RefineRole", "first"))
+    copy = dataclasses.replace(context, patch="diff")
+    copy.add_feedback(_feedback(None, "second"))
+
+    assert [fb.message for fb in copy.get_feedback_for_role("RefineRole")] == ["first", "second"]
+
+
+def test_execution_timestamps_have_a_fixed_width():
+    """Test that timestamps keep their milliseconds even on whole seconds."""
+    assert _iso_for_tick(17000000000).endswith(".000")
+    assert _iso_for_tick(17000000001).endswith(".100")
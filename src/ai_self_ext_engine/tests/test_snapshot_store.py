@@ -0,0 +1,116 @@
+import pytest
+import json
+import sys
+import threading
+import time
+
+from ai_self_ext_engine.core.role import Context
+from ai_self_ext_engine.goal_manager import Goal
+from ai_self_ext_engine.snapshot_store import SnapshotStore
+
+@pytest.fixture
+def store(tmp_path):
+    """Creates a SnapshotStore rooted in a temporary directory."""
+    return SnapshotStore(str(tmp_path / "memory"))
+
+@pytest.fixture
+def context():
+    """Creates a Context with a goal and some recorded state."""
+    ctx = Context(code_dir=".", goal=Goal("goal1", "Description for goal 1"))
+    ctx.todos = ["first", "second"]
+    ctx.patch = "--- a/x.py\n+++ b/x.py\n"
+    ctx.accepted = True
+    ctx.metadata = {"cycle": 1, "timestamp": "2025-01-01T00:00:00"}
+    return ctx
+
+def test_record_writes_json_snapshot(store, context):
+    """Test that record writes a readable JSON file under the goal's directory."""
+    store.record(context)
+    store.flush()
+    files = list((store.memory_dir / "goal1").glob("*.json"))
+    assert len(files) == 1
+    data = json.loads(files[0].read_text(encoding="utf-8"))
+    assert data["goal_id"] == "goal1"
+    assert data["todos"] == ["first", "second"]
+    assert data["accepted"] is True
+
+def test_record_then_load_latest_round_trip(store, context):
+    """Test that load_latest reconstructs the recorded context fields."""
+    store.record(context)
+    loaded = store.load_latest("goal1")
+    assert loaded is not None
+    assert loaded.todos == context.todos
+    assert loaded.patch == context.patch
+    assert loaded.accepted is True
+    assert loaded.metadata == context.metadata
+
+def test_has_and_missing_goal(store, context):
+    """Test has() before and after recording, and load_latest for unknown goals."""
+    assert not store.has(context.goal)
+    store.record(context)
+    assert store.has(context.goal)
+    assert store.load_latest("unknown") is None
+
+def test_record_is_buffered_until_flush(store, context):
+    """Test that buffered snapshots are visible to has/load_latest before hitting disk."""
+    store.record(context)
+    assert not (store.memory_dir / "goal1").exists() or not any((store.memory_dir / "goal1").iterdir())
+    assert store.has(context.goal)
+    assert store.load_latest("goal1").todos == context.todos
+    with store:
+        pass
+    assert len(list((store.memory_dir / "goal1").glob("*.json"))) == 1
+
+def test_record_flushes_when_buffer_is_full(tmp_path, context):
+    """Test that reaching max_buffered triggers a flush."""
+    store = SnapshotStore(str(tmp_path / "memory"), max_buffered=1)
+    store.record(context)
+    assert len(list((store.memory_dir / "goal1").glob("*.json"))) == 1
+
+def test_record_flushes_after_max_delay(tmp_path, context):
+    """Test that a buffered snapshot reaches disk within max_delay without an explicit flush."""
+    store = SnapshotStore(str(tmp_path / "memory"), max_delay=0.05)
+    store.record(context)
+    snapshot_dir = store.memory_dir / "goal1"
+    deadline = time.monotonic() + 5
+    while not list(snapshot_dir.glob("*.json")) and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert len(list(snapshot_dir.glob("*.json"))) == 1
+
+def test_load_latest_returns_newest_snapshot(tmp_path, context):
+    """Test that load_latest picks the most recent snapshot, also in a fresh store."""
+    store = SnapshotStore(str(tmp_path / "memory"), max_buffered=1)
+    store.record(context)
+    context.metadata = {"cycle": 2, "timestamp": "2025-01-02T00:00:00"}
+    store.record(context)
+    assert store.load_latest("goal1").metadata["cycle"] == 2
+    assert SnapshotStore(str(tmp_path / "memory")).load_latest("goal1").metadata["cycle"] == 2
+
+def test_concurrent_record_and_load(tmp_path):
+    """Test that goals recording and loading from several threads don't race on the buffer."""
+    store = SnapshotStore(str(tmp_path / "memory"), max_buffered=1000)
+    errors = []
+
+    def worker(n):
+        try:
+            for i in range(200):
+                ctx = Context(code_dir=".", goal=Goal(f"goal{n}", "d"))
+                ctx.metadata = {"cycle": i, "timestamp": f"2025-01-01T00:00:{i:03d}"}
+                store.record(ctx)
+                store.load_latest(f"goal{(n + 1) % 4}")
+                store.has(Goal(f"goal{(n + 2) % 4}", "d"))
+        except Exception as e:  # pragma: no cover - reported below
+            errors.append(e)
+
+    threads = [threading.Thread(target=worker, args=(n,)) for n in range(4)]
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)  # switch threads often enough to hit the race
+    try:
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+    finally:
+        sys.setswitchinterval(interval)
+    assert errors == []
+    assert store.load_latest("goal0").metadata["cycle"] == 199
@@ -1,10 +1,12 @@
 from typing import List, Dict, Any, Optional, Literal
-from pydantic import BaseModel, Field, ValidationError, validator
+from pydantic import BaseModel, ConfigDict, Field, ValidationError, field_validator
 
 class EngineConfig(BaseModel):
     """
     Configuration schema for the AI Self-Extending Engine.
     """
+    model_config = ConfigDict(frozen=True, extra='forbid')
+
     code_dir: str = Field(..., description="Path to the codebase directory.")
     memory_path: str = Field(".sim_memory", description="Path to the memory/snapshot directory.")
     max_cycles: int = Field(1, description="Maximum number of improvement cycles to run.")
@@ -35,7 +37,8 @@ class EngineConfig(BaseModel):
     # Internal versioning for config schema (for future compatibility)
     config_version: Literal["1.0.0"] = Field("1.0.0")
 
-    @validator('max_cycles')
+    @field_validator('max_cycles')
+    @classmethod
     def validate_max_cycles(cls, v):
         if v <= 0:
             raise ValueError('max_cycles must be a positive integer')
@@ -1,7 +1,14 @@
 import os
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Optional
 from google import genai
 
+def _system_turns(system_prompt: str) -> list:
+    # Fresh dicts per call: the SDK and callers may mutate the contents list
+    return [
+        {"role": "user", "parts": [{"text": system_prompt}]},
+        {"role": "model", "parts": [{"text": "Okay, I understand."}]}, # Standard response to system prompt
+    ]
+
 class ModelCallError(Exception):
     """Custom exception for errors during model calls."""
     pass
@@ -39,10 +46,7 @@ class ModelClient:
 
         try:
             # Construct contents based on system_prompt presence
-            contents = []
-            if system_prompt:
-                contents.append({"role": "user", "parts": [{"text": system_prompt}]})
-                contents.append({"role": "model", "parts": [{"text": "Okay, I understand."}]}) # Standard response to system prompt
+            contents = _system_turns(system_prompt) if system_prompt else []
             contents.append({"role": "user", "parts": [{"text": prompt}]})
 
             response = self._client.models.generate_content(
@@ -0,0 +1,44 @@
+import difflib
+
+from ast_utils import AstUtils, _unified_diff
+
+# Hunks as written by `diff -u` when one side lacks a trailing newline
+REMOVED_LINE_WITHOUT_NEWLINE = """\
+--- a/x.py
++++ b/x.py
+@@ -1,4 +1,3 @@
+-y
+ x
++r
+ z
+-x
+\\ No newline at end of file
+"""
+
+ADDED_LINE_WITHOUT_NEWLINE = """\
+--- a/x.py
++++ b/x.py
+@@ -1,3 +1,3 @@
+-y
+ x
+-z
++r
++z
+\\ No newline at end of file
+"""
+
+
+def test_no_newline_marker_after_removed_line_keeps_new_newline():
+    """The marker after a '-' line describes the old file only."""
+    assert AstUtils.apply_patch("y\nx\nz\nx", REMOVED_LINE_WITHOUT_NEWLINE) == "x\nr\nz\n"
+
+
+def test_no_newline_marker_after_added_line_strips_newline():
+    """The marker after a '+' line drops the new file's final newline."""
+    assert AstUtils.apply_patch("y\nx\nz\n", ADDED_LINE_WITHOUT_NEWLINE) == "x\nr\nz"
+
+
+def test_unified_diff_matches_difflib():
+    """Hunk headers, including empty and single-line ranges, match difflib's."""
+    for a, b in [([], ["x"]), (["x"], []), (["a", "b", "c"], ["a", "c", "d"]), (["a"] * 10, ["b"] + ["a"] * 10)]:
+        assert list(_unified_diff(a, b)) == list(difflib.unified_diff(a, b, lineterm=''))
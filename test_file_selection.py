@@ -0,0 +1,25 @@
+from file_selection import select_relevant_files
+
+FILES = {
+    "goal_manager.py": "class GoalManager:\n    pass\n",
+    "utils.py": 'def helper():\n    return "this should be used"\n',
+}
+
+
+def test_ignores_stop_words_and_substrings():
+    """'this' and 'should' appear in utils.py, but as stop words they don't select it."""
+    selected = select_relevant_files(
+        FILES, ["Make GoalManager cache lookups; this should be faster"]
+    )
+    assert list(selected) == ["goal_manager.py"]
+
+
+def test_falls_back_to_all_files():
+    """A todo with no usable identifiers keeps every file."""
+    assert select_relevant_files(FILES, ["fix it"]) == FILES
+
+
+def test_matches_whole_identifiers_only():
+    """'GoalManager' in a todo does not select a file that only mentions GoalManagerFactory."""
+    files = dict(FILES, **{"factory.py": "manager = GoalManagerFactory()\n"})
+    assert list(select_relevant_files(files, ["Speed up GoalManager"])) == ["goal_manager.py"]